@@ -5,19 +5,40 @@ seamm_installer
 The installer/updater for SEAMM.
 """
 
-# Bring up the classes so that they appear to be directly in
-# the seamm_installer package.
+import importlib
 
-from seamm_installer.conda import Conda  # noqa: F401
-from seamm_installer.configuration import Configuration  # noqa: F401
-from seamm_installer.installer_base import InstallerBase  # noqa: F401
 from . import my  # noqa: F401
-from seamm_installer.pip import Pip  # noqa: F401
 import seamm_installer.my  # noqa: F401
 
 # Handle versioneer
 from ._version import get_versions
 
+# Bring up the classes so that they appear to be directly in
+# the seamm_installer package. They are only imported when first used,
+# so that e.g. the command-line help does not pay for them.
+_lazy_classes = {
+    "Conda": "seamm_installer.conda",
+    "Configuration": "seamm_installer.configuration",
+    "InstallerBase": "seamm_installer.installer_base",
+    "Pip": "seamm_installer.pip",
+}
+
+__all__ = [*_lazy_classes, "my"]
+
+
+def __getattr__(name):
+    """Import the classes brought up to the package on first access."""
+    if name in _lazy_classes:
+        value = getattr(importlib.import_module(_lazy_classes[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted([*globals(), *_lazy_classes])
+
+
 __author__ = """Paul Saxe"""
 __email__ = "psaxe@molssi.org"
 versions = get_versions()
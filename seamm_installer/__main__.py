@@ -4,60 +4,110 @@
 """
 import argparse
 import logging
+import os
 import sys
 
 import seamm_installer
-from . import cli
+from . import _logconfig
 from . import my
 from . import util
 
 my.logger = logging.getLogger(__name__)
 
+# The help text for the top-level options
+_EPILOG = "If no positional argument is given, the GUI will appear."
+_VERSION = f"SEAMM Installer version {seamm_installer.__version__}"
+_HELP_LOG_LEVEL = "The level of informational output, defaults to '%(default)s'"
+_HELP_REFRESH_CONDA = "Re-read the Conda configuration rather than using the cache."
+_HELP_DEVELOPMENT = "Work with the development environment, not the production one."
+_HELP_NO_DEVELOPMENT = "Work with the production environment, not the development one."
 
-def run():
-    """Run the installer.
 
-    The installer uses nested parsers to handle commands and options on the
-    command line. Each subparser has a default command which is how the code
-    calls the requested method.
-    """
-    # Get the Conda environment
-    util.initialize()
-    my.environment = my.conda.active_environment
+def _build_toplevel_parser(development):
+    """Create the parser with the options common to all subcommands.
 
-    # Create the argument parser and set the debug level ASAP
-    parser = argparse.ArgumentParser(
-        epilog="If no positional argument is given, the GUI will appear."
-    )
+    Parameters
+    ----------
+    development : bool
+        Whether the Conda environment is a development one, which determines
+        whether there is a '--development' or '--no-development' option.
 
-    parser.add_argument(
-        "--version",
-        action="version",
-        version=f"SEAMM Installer version {seamm_installer.__version__}",
-    )
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser.
+    """
+    parser = argparse.ArgumentParser(epilog=_EPILOG)
+
+    parser.add_argument("--version", action="version", version=_VERSION)
     parser.add_argument(
         "--log-level",
         default="WARNING",
-        type=str.upper,
-        choices=["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help=("The level of informational output, defaults to " "'%(default)s'"),
+        type=_logconfig.log_level,
+        metavar=_logconfig.LOG_LEVEL_METAVAR,
+        help=_HELP_LOG_LEVEL,
     )
-    if my.environment is not None and "dev" in my.environment:
-        my.development = True
+    parser.add_argument(
+        "--refresh-conda",
+        action="store_true",
+        help=_HELP_REFRESH_CONDA,
+    )
+    if development:
         parser.add_argument(
             "--no-development",
             dest="development",
             action="store_false",
-            help="Work with the production environment, not the development one.",
+            help=_HELP_NO_DEVELOPMENT,
         )
     else:
-        my.development = False
         parser.add_argument(
             "--development",
             action="store_true",
-            help="Work with the development environment, not the production one.",
+            help=_HELP_DEVELOPMENT,
         )
 
+    return parser
+
+
+def _set_development(development):
+    """Set whether working with the development installation, and the root.
+
+    Parameters
+    ----------
+    development : bool
+        Whether to work with the development installation.
+    """
+    my.development = development
+    my.default_root = "~/SEAMM_DEV" if development else "~/SEAMM"
+
+
+def run():
+    """Run the installer.
+
+    The installer uses nested parsers to handle commands and options on the
+    command line. Each subparser has a default command which is how the code
+    calls the requested method.
+    """
+    from . import cli
+
+    # The top-level help needs neither Conda nor the subcommands, so short-circuit
+    if cli.wants_help():
+        environment = os.environ.get("CONDA_DEFAULT_ENV")
+        _set_development(environment is not None and "dev" in environment)
+        parser = _build_toplevel_parser(my.development)
+        parser.add_argument("--root", type=str, default=my.default_root)
+        cli.setup(parser)
+        parser.print_help()
+        sys.exit(0)
+
+    # Get the Conda environment, using the cached information unless asked not to
+    util.initialize(refresh="--refresh-conda" in sys.argv)
+    my.environment = my.conda.active_environment
+    _set_development(my.environment is not None and "dev" in my.environment)
+
+    # Create the argument parser and set the debug level ASAP
+    parser = _build_toplevel_parser(my.development)
+
     # Parse the first options
     if "-h" not in sys.argv and "--help" not in sys.argv:
         options, _ = parser.parse_known_args()
@@ -65,16 +115,13 @@ def run():
 
         # Set up the logging
         level = kwargs.pop("log_level", "WARNING")
-        logging.basicConfig(level=level)
+        _logconfig.configure(level)
 
-        my.development = kwargs.pop("development", False)
+        _set_development(kwargs.pop("development", False))
 
-    # Now setup the rest of the command-line interface.
-    parser.add_argument(
-        "--root",
-        type=str,
-        default="~/SEAMM_DEV" if my.development else "~/SEAMM",
-    )
+    # Now setup the rest of the command-line interface. The subcommands are only
+    # imported now, after the first options have been handled.
+    parser.add_argument("--root", type=str, default=my.default_root)
 
     cli.setup(parser)
 
@@ -85,10 +132,8 @@ def run():
             sys.exit(my.options.func())
         except AttributeError:
             print(f"Missing arguments to seamm-installer {' '.join(sys.argv[1:])}")
-            # Append help so help will be printed
-            sys.argv.append("--help")
-            # re-run
-            run()
+            # Print the help for the command using the existing parser, which exits
+            parser.parse_args([*sys.argv[1:], "--help"])
     else:
         from .gui import GUI
 
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+
+"""Configure the logging for the SEAMM installer once per process."""
+
+import argparse
+import logging
+
+LOG_LEVELS = ("NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+LOG_LEVEL_METAVAR = "{" + ",".join(LOG_LEVELS) + "}"
+_log_levels = frozenset(LOG_LEVELS)
+
+_configured = False
+
+
+def configure(level="WARNING"):
+    """Set up the logging and set the level of the root logger.
+
+    The handlers are created only the first time this is called. Later calls
+    just change the level.
+
+    Parameters
+    ----------
+    level : str or int = "WARNING"
+        The logging level.
+    """
+    global _configured
+    if not _configured:
+        logging.basicConfig()
+        _configured = True
+    logging.getLogger().setLevel(level)
+
+
+def log_level(text):
+    """Convert a logging level on the command line, ignoring case.
+
+    Use as the `type` of an argparse argument in place of `choices`.
+
+    Parameters
+    ----------
+    text : str
+        The level given on the command line.
+
+    Returns
+    -------
+    str
+        The level in uppercase.
+    """
+    level = text.upper()
+    if level not in _log_levels:
+        raise argparse.ArgumentTypeError(
+            f"invalid choice: '{text}' (choose from {', '.join(LOG_LEVELS)})"
+        )
+    return level
@@ -2,13 +2,11 @@
 
 """Handle the apps for SEAMM."""
 
+import importlib.resources
 from pathlib import Path
-import pkg_resources
 import platform
 import shutil
 
-from tabulate import tabulate
-
 from . import my
 
 system = platform.system()
@@ -110,11 +108,14 @@ def setup(parser):
 def create():
     """Create the requested apps."""
     apps = get_apps()
+    packages = my.conda.list_installed()
+    data_path = importlib.resources.files("seamm_installer") / "data"
+    icons_path = Path(str(data_path / icons))
+    root = my.default_root
     for app in my.options.apps:
         app_lower = app.lower()
         app = app_names[app_lower]
         app_name = f"{app}-dev" if my.development else app
-        packages = my.conda.list()
         package = app_package[app_lower]
         if package in packages:
             version = str(packages[package]["version"])
@@ -134,10 +135,6 @@ def create():
 
             delete_app(app_name)
 
-        data_path = Path(pkg_resources.resource_filename("seamm_installer", "data/"))
-        icons_path = data_path / icons
-        root = "~/SEAMM_DEV" if my.development else "~/SEAMM"
-
         if app_lower == "dashboard":
             bin_path = shutil.which("seamm-dashboard")
             create_app(
@@ -191,6 +188,9 @@ def delete():
 
 
 def show():
+    # Only showing the apps needs tabulate, so only import it here.
+    from tabulate import tabulate
+
     apps = get_apps()
 
     table = []
@@ -215,7 +215,7 @@ def show():
 
 def update():
     apps = get_apps()
-    packages = my.conda.list()
+    packages = my.conda.list_installed()
     for app in my.options.apps:
         app_lower = app.lower()
         app = app_names[app_lower]
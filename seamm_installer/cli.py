@@ -2,37 +2,105 @@
 
 """Define the command-line interface for the SEAMM installer."""
 
-from . import apps
-from . import cache
-from . import datastore
-from . import install
-from . import services
-from . import show
-from . import uninstall
-from . import update
+import importlib
+import sys
 
+# The subcommands and the modules that define them, in the order they are listed
+# in the help. The modules are only imported when their subcommand is requested.
+commands = {
+    "refresh-cache": "cache",
+    "datastore": "datastore",
+    "install": "install",
+    "show": "show",
+    "uninstall": "uninstall",
+    "update": "update",
+    "apps": "apps",
+    "services": "services",
+}
 
-def setup(parser):
+# One-line descriptions of the subcommands for the top-level help.
+descriptions = {
+    "refresh-cache": "Refresh the cache of SEAMM components and plug-ins.",
+    "datastore": "Show or update the datastore used by the Dashboard.",
+    "install": "Install SEAMM components and plug-ins.",
+    "show": "Show the status of the SEAMM installation.",
+    "uninstall": "Uninstall SEAMM components and plug-ins.",
+    "update": "Update SEAMM components and plug-ins.",
+    "apps": "Create and manage the shortcuts (apps) for SEAMM.",
+    "services": "Create and manage the Dashboard and JobServer services.",
+}
+
+
+# The top-level options that take a value, which is not a subcommand.
+_options_with_values = frozenset(("--log-level", "--root"))
+
+
+def requested_command(argv=None):
+    """The subcommand given on the command line, if any.
+
+    The subcommand is the first positional argument, which is looked up directly
+    rather than going through the full argparse machinery.
+
+    Parameters
+    ----------
+    argv : [str] = None
+        The command-line arguments, defaulting to sys.argv[1:].
+
+    Returns
+    -------
+    str
+        The name of the subcommand, or None if there is none or it is unknown.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    args = iter(argv)
+    for arg in args:
+        if arg in _options_with_values:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg if arg in commands else None
+    return None
+
+
+def wants_help(argv=None):
+    """Whether only the top-level help is requested.
+
+    Parameters
+    ----------
+    argv : [str] = None
+        The command-line arguments, defaulting to sys.argv[1:].
+
+    Returns
+    -------
+    bool
+        True if there is '-h' or '--help' but no subcommand.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    return ("-h" in argv or "--help" in argv) and requested_command(argv) is None
+
+
+def setup(parser, argv=None):
     """Setup the comand-line interface for the SEAMM installer.
 
+    Only the subcommand actually requested on the command line is fully
+    constructed. If there is no subcommand, e.g. for the top-level help or the GUI,
+    bare parsers are registered so that the subcommands are still listed.
+
     Parameters
     ----------
     parser : argparse.ArgumentParser
         The main parser for the application.
 
-    logger : logging.Logger
-        The logger for output.
-
-    environment : str
-        The Conda environment name
+    argv : [str] = None
+        The command-line arguments, defaulting to sys.argv[1:].
     """
     subparser = parser.add_subparsers()
 
-    cache.setup(subparser)
-    datastore.setup(subparser)
-    install.setup(subparser)
-    show.setup(subparser)
-    uninstall.setup(subparser)
-    update.setup(subparser)
-    apps.setup(subparser)
-    services.setup(subparser)
+    command = requested_command(argv)
+    if command is None:
+        for name in commands:
+            subparser.add_parser(name, help=descriptions[name])
+    else:
+        module = importlib.import_module(f".{commands[command]}", __package__)
+        module.setup(subparser)
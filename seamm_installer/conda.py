@@ -3,7 +3,9 @@ import json
 import logging
 import os
 from pathlib import Path
+import selectors
 import shlex
+import shutil
 import subprocess
 import sys
 import warnings
@@ -17,19 +19,39 @@ class Conda(object):
 
     Attributes
     ----------
-
+    cache_path : pathlib.Path
+        Optional file for caching the output of 'conda info --json'.
+    package_command : str
+        The command used to install, update and uninstall packages: 'mamba' if it
+        is available, since its solver is much faster, otherwise 'conda'.
     """
 
-    def __init__(self, logger=logger):
-        logger.debug(f"Creating Conda {str(type(self))}")
+    def __init__(self, logger=logger, cache_path=None, refresh=False):
+        """Initialize the Conda object.
+
+        Parameters
+        ----------
+        logger : logging.Logger
+            The logger to use.
+        cache_path : str or pathlib.Path = None
+            A file for caching the Conda information between runs. If None,
+            'conda info' is run every time.
+        refresh : bool = False
+            Ignore any cached information, running 'conda info'.
+        """
+        logger.debug("Creating Conda %s", type(self))
 
         self._is_installed = False
         self._data = None
         self.logger = logger
         self.channels = ["local", "conda-forge"]
+        self.package_command = "mamba" if shutil.which("mamba") else "conda"
         self.root_path = None
+        self.cache_path = None if cache_path is None else Path(cache_path)
+        # The packages in the current environment, cleared when they are changed.
+        self._installed_cache = None
 
-        self._initialize()
+        self._initialize(use_cache=not refresh)
 
     def __str__(self):
         """Print the conda information in a nice format."""
@@ -50,12 +72,12 @@ class Conda(object):
     def environments(self):
         """The available conda environments."""
         self.logger.debug("Getting list of environment")
-        self.logger.debug(f"   root path = {self.root_path}")
+        self.logger.debug("   root path = %s", self.root_path)
         if self.is_installed:
             result = []
             for env in self._data["envs"]:
                 path = Path(env)
-                self.logger.debug(f"   environment {env}")
+                self.logger.debug("   environment %s", env)
                 if path == self.root_path:
                     result.append("base")
                     self.logger.debug("    --> base")
@@ -66,7 +88,7 @@ class Conda(object):
                         self.logger.debug("    --> base")
                     else:
                         result.append(path.name)
-                        self.logger.debug(f"    --> {path.name}")
+                        self.logger.debug("    --> %s", path.name)
             return result
         else:
             return None
@@ -117,21 +139,75 @@ class Conda(object):
         os.environ["CONDA_PREFIX"] = str(self.path(environment))
         os.environ["CONDA_DEFAULT_ENV"] = environment
 
-    def _initialize(self):
-        """Get the information about the current Conda installation."""
-        command = "conda info --json"
-        args = shlex.split(command)
+        # The installed packages are those of the new environment.
+        self.invalidate()
+
+    def _cache_key(self):
+        """The key identifying the Conda installation for the cache.
+
+        Returns
+        -------
+        [str]
+            The key, or None if conda cannot be found.
+        """
+        exe = shutil.which("conda")
+        if exe is None:
+            return None
+        key = [exe, str(os.stat(exe).st_mtime_ns)]
+        for variable in ("CONDA_PREFIX", "CONDA_DEFAULT_ENV"):
+            key.append(os.environ.get(variable, ""))
+        # The list of environments changes when they are created or removed.
+        path = Path("~/.conda/environments.txt").expanduser()
+        key.append(str(path.stat().st_mtime_ns) if path.exists() else "")
+        return key
+
+    def _read_cache(self, key):
+        """Return the cached output of 'conda info --json', if it is valid."""
         try:
-            result = subprocess.check_output(
-                args, shell=False, text=True, stderr=subprocess.STDOUT
-            )
-        except subprocess.CalledProcessError as e:
-            self.logger.debug(f"Calling conda, returncode = {e.returncode}")
-            self.logger.debug(f"Output:\n\n{e.output}\n\n")
+            with self.cache_path.open("r") as fd:
+                cache = json.load(fd)
+        except (OSError, ValueError):
+            return None
+        if cache.get("key") != key:
+            return None
+        return cache.get("info")
 
-            self._is_installed = False
-            self._data = None
-            return
+    def _write_cache(self, key, info):
+        """Save the output of 'conda info --json' for later runs."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.cache_path.open("w") as fd:
+                json.dump({"key": key, "info": info}, fd)
+        except OSError as e:
+            self.logger.debug(f"Could not write the conda cache: {e}")
+
+    def _initialize(self, use_cache=False):
+        """Get the information about the current Conda installation.
+
+        Parameters
+        ----------
+        use_cache : bool = False
+            Use the cached information, if there is a cache and it is valid.
+        """
+        key = None if self.cache_path is None else self._cache_key()
+        result = None
+        if use_cache and key is not None:
+            result = self._read_cache(key)
+        cached = result is not None
+
+        if not cached:
+            args = ["conda", "info", "--json"]
+            try:
+                result = subprocess.check_output(
+                    args, shell=False, text=True, stderr=subprocess.STDOUT
+                )
+            except subprocess.CalledProcessError as e:
+                self.logger.debug("Calling conda, returncode = %s", e.returncode)
+                self.logger.debug("Output:\n\n%s\n\n", e.output)
+
+                self._is_installed = False
+                self._data = None
+                return
 
         # Fixing error on condaforge
         if result is None:
@@ -140,13 +216,15 @@ class Conda(object):
             return
 
         self._is_installed = True
-        self.logger.debug(f"\nconda info --json\n\n{result}\n\n")
+        self.logger.debug("\nconda info --json\n\n%s\n\n", result)
         try:
             self._data = json.loads(result)
         except Exception:
             self._is_installed = False
             self._data = None
             return
+        if not cached and key is not None:
+            self._write_cache(key, result)
 
         # Find the root path for the environment
         # Typically the base environment is e.g. ~/opt/miniconda3 and all other
@@ -173,8 +251,14 @@ class Conda(object):
         # self.root_path = root
         self.root_path = Path(self._data["conda_prefix"])
 
-        tmp = "\n\t".join(self.environments)
-        self.logger.info(f"environments:\n\t{tmp}")
+        # Listing the environments is only needed for the log.
+        if self.logger.isEnabledFor(logging.INFO):
+            tmp = "\n\t".join(self.environments)
+            self.logger.info("environments:\n\t%s", tmp)
+
+    def invalidate(self):
+        """Forget the cached information about installed packages."""
+        self._installed_cache = None
 
     def create_environment(self, environment_file, name=None, force=False):
         """Create a Conda environment.
@@ -194,15 +278,15 @@ class Conda(object):
         else:
             path = environment_file
 
-        command = f"conda env create --file '{path}'"
+        command = ["conda", "env", "create", "--file", path]
         if force:
-            command += " --force"
+            command.append("--force")
         if name is not None:
             # Using the name leads to odd paths, so be explicit.
-            # command += f" --name '{name}'"
+            # command.extend(["--name", name])
             path = self.root_path / "envs" / name
-            command += f" --prefix '{str(path)}'"
-        self.logger.debug(f"command = {command}")
+            command.extend(["--prefix", str(path)])
+        self.logger.debug(f"command = {shlex.join(command)}")
         try:
             self._execute(command)
         except subprocess.CalledProcessError as e:
@@ -223,9 +307,9 @@ class Conda(object):
         # Using the name leads to odd paths, so be explicit.
         path = self.root_path / "envs" / name
 
-        command = f"conda env remove --yes  --prefix '{str(path)}'"
+        command = ["conda", "env", "remove", "--yes", "--prefix", str(path)]
 
-        self.logger.debug(f"command = {command}")
+        self.logger.debug(f"command = {shlex.join(command)}")
         try:
             self._execute(command)
         except subprocess.CalledProcessError as e:
@@ -279,28 +363,49 @@ class Conda(object):
         update : None or method
             Method to call to e.g. update a progress bar
         """
-        command = "conda install --yes "
+        command = [self.package_command, "install", "--yes"]
         if environment is not None:
             # Using the name leads to odd paths, so be explicit.
-            # command += f" --name '{environment}'"
+            # command.extend(["--name", environment])
             path = self.root_path / "envs" / environment
-            command += f" --prefix '{str(path)}'"
+            command.extend(["--prefix", str(path)])
         if override_channels:
-            command += " --override-channels"
+            command.append("--override-channels")
         if channels is None:
             for channel in self.channels:
-                command += f" -c {channel}"
+                command.extend(["-c", channel])
         else:
             for channel in channels:
-                command += f" -c {channel}"
+                command.extend(["-c", channel])
 
         if isinstance(package, list):
-            packages = " ".join(package)
-            command += f" {packages}"
+            command.extend(package)
         else:
-            command += f" {package}"
+            command.append(package)
 
-        self._execute(command, progress=progress, newline=newline, update=update)
+        # Installing one package may change others, so forget them all once conda
+        # is done, so that nothing can cache the listing from before the change.
+        try:
+            self._execute(command, progress=progress, newline=newline, update=update)
+        finally:
+            self.invalidate()
+
+    def list_installed(self):
+        """The packages in the current environment, from one call to conda.
+
+        The result is cached until a package is installed, updated or uninstalled,
+        so it should not be modified.
+
+        Returns
+        -------
+        dict
+            A dictionary keyed by the package names.
+        """
+        if self._installed_cache is None:
+            self._installed_cache = self.list()
+            if self._installed_cache is None:
+                self._installed_cache = {}
+        return self._installed_cache
 
     def list(self, environment=None, query=None, fullname=False, update=None):
         """The contents of an environment.
@@ -319,15 +424,15 @@ class Conda(object):
         dict
             A dictionary keyed by the package names.
         """
-        command = "conda list --json"
+        command = ["conda", "list", "--json"]
         if environment is not None:
-            command += f" --name '{environment}'"
+            command.extend(["--name", environment])
         if fullname:
-            command += " --full-name"
+            command.append("--full-name")
         if query is not None:
-            command += f" '{query}'"
+            command.append(query)
 
-        self.logger.debug(f"command = {command}")
+        self.logger.debug(f"command = {shlex.join(command)}")
 
         try:
             result, stdout, stderr = self._execute(
@@ -380,7 +485,7 @@ class Conda(object):
         environment : str
             The name of the environment to remove.
         """
-        command = f"conda env remove --name '{environment}' --yes --json"
+        command = ["conda", "env", "remove", "--name", environment, "--yes", "--json"]
         try:
             self._execute(command)
         except subprocess.CalledProcessError as e:
@@ -422,17 +527,17 @@ class Conda(object):
         dict
             A dictionary of packages, with versions for each.
         """
-        command = "conda search --json"
+        command = ["conda", "search", "--json"]
         if override_channels:
-            command += " --override-channels"
+            command.append("--override-channels")
         if channels is None:
             for channel in self.channels:
-                command += f" -c {channel}"
+                command.extend(["-c", channel])
         else:
             for channel in channels:
-                command += f" -c {channel}"
+                command.extend(["-c", channel])
         if query is not None:
-            command += f" {query}"
+            command.append(query)
 
         _, stdout, _ = self._execute(
             command, progress=progress, newline=newline, update=update
@@ -441,7 +546,7 @@ class Conda(object):
             output = json.loads(stdout)
         except Exception as e:
             self.logger.warning(
-                f"expected output from {command}, got {stdout}", exc_info=e
+                f"expected output from {shlex.join(command)}, got {stdout}", exc_info=e
             )
             return None
 
@@ -466,13 +571,7 @@ class Conda(object):
         package : str
             The name of the package.
         """
-        # Should be able to use fullname=True, but conda has a bug! Use regexp.
-        result = self.list(query="^" + package + "$")
-        if result is None:
-            return None
-        if package not in result:
-            return None
-        return result[package]
+        return self.list_installed().get(package)
 
     def update(
         self,
@@ -506,33 +605,35 @@ class Conda(object):
         update : None or method
             Method to call to e.g. update a progress bar
         """
-        command = "conda update --yes "
+        command = [self.package_command, "update", "--yes"]
         if environment is not None:
             # Using the name leads to odd paths, so be explicit.
-            # command += f" --name '{environment}'"
+            # command.extend(["--name", environment])
             path = self.root_path / "envs" / environment
-            command += f" --prefix '{str(path)}'"
+            command.extend(["--prefix", str(path)])
         if override_channels:
-            command += " --override-channels"
+            command.append("--override-channels")
         if channels is None:
             for channel in self.channels:
-                command += f" -c {channel}"
+                command.extend(["-c", channel])
         else:
             for channel in channels:
-                command += f" -c {channel}"
+                command.extend(["-c", channel])
 
         if all:
-            command += " --all"
+            command.append("--all")
         else:
             if package is None:
                 raise RuntimeError("Conda update requires either '--all' of a package")
             if isinstance(package, list):
-                packages = " ".join(package)
-                command += f" {packages}"
+                command.extend(package)
             else:
-                command += f" {package}"
+                command.append(package)
 
-        self._execute(command, progress=progress, newline=newline, update=update)
+        try:
+            self._execute(command, progress=progress, newline=newline, update=update)
+        finally:
+            self.invalidate()
 
     def uninstall(
         self,
@@ -548,8 +649,8 @@ class Conda(object):
 
         Parameters
         ----------
-        package: str
-            The package to uninstall install.
+        package: str or [str]
+            The package to uninstall install, or a list of packages.
         environment : str
             The name of the environment to list, defaults to the current.
         channels: [str] = None
@@ -562,21 +663,32 @@ class Conda(object):
             Whether to print a newline at the end if showing progress
         update : None or method
             Method to call to e.g. update a progress bar
+
+        Returns
+        -------
+        (int, str, str)
+            The return code from conda, and its stdout and stderr.
         """
-        command = "conda uninstall --yes "
+        command = [self.package_command, "uninstall", "--yes"]
         if environment is not None:
-            command += f" --name '{environment}'"
+            command.extend(["--name", environment])
         if override_channels:
-            command += " --override-channels"
+            command.append("--override-channels")
         if channels is None:
             for channel in self.channels:
-                command += f" -c {channel}"
+                command.extend(["-c", channel])
         else:
             for channel in channels:
-                command += f" -c {channel}"
-        command += f" {package}"
+                command.extend(["-c", channel])
+        if isinstance(package, list):
+            command.extend(package)
+        else:
+            command.append(package)
 
-        self._execute(command)
+        try:
+            return self._execute(command)
+        finally:
+            self.invalidate()
 
     def update_environment(self, environment_file, name=None):
         """Update a Conda environment.
@@ -593,19 +705,21 @@ class Conda(object):
         else:
             path = environment_file
 
-        command = f"conda env update --file '{path}'"
+        command = ["conda", "env", "update", "--file", path]
         if name is not None:
             # Using the name leads to odd paths, so be explicit.
-            # command += f" --name '{name}'"
+            # command.extend(["--name", name])
             path = self.root_path / "envs" / name
-            command += f" --prefix '{str(path)}'"
-        self.logger.debug(f"command = {command}")
+            command.extend(["--prefix", str(path)])
+        self.logger.debug(f"command = {shlex.join(command)}")
         try:
             self._execute(command)
         except subprocess.CalledProcessError as e:
             self.logger.warning(f"Calling conda, returncode = {e.returncode}")
             self.logger.warning(f"Output:\n\n{e.output}\n\n")
             raise
+        finally:
+            self.invalidate()
 
     def _execute(
         self, command, poll_interval=2, progress=True, newline=True, update=None
@@ -614,10 +728,11 @@ class Conda(object):
 
         Parameters
         ----------
-        command : str
-            The command, with any arguments, to execute.
+        command : [str] or str
+            The command and its arguments, or a string to be split like a shell
+            command line.
         poll_interval : int
-            Time interval in seconds for checking for output.
+            Time in seconds without output before showing progress.
         progress : bool = True
             Whether to show progress dots.
         newline : bool = True
@@ -625,46 +740,57 @@ class Conda(object):
         update : None or method
             Method to call to e.g. update a progress bar
         """
-        self.logger.info(f"running '{command}'")
-        args = shlex.split(command)
+        if isinstance(command, str):
+            args = shlex.split(command)
+        else:
+            args = command
+        self.logger.info("running %s", shlex.join(args))
         process = subprocess.Popen(
             args,
-            bufsize=1,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            universal_newlines=True,
         )
+        # Read the output as it arrives, showing progress whenever there is a pause.
+        # The pipes are read in chunks, which never block, so neither can fill up.
+        chunks = {process.stdout: [], process.stderr: []}
         n = 0
-        stdout = ""
-        stderr = ""
-        while True:
-            self.logger.debug("    checking if finished")
-            result = process.poll()
-            if result is not None:
-                self.logger.info(f"    finished! result = {result}")
-                break
-            try:
-                self.logger.debug("    calling communicate")
-                output, errors = process.communicate(timeout=poll_interval)
-            except subprocess.TimeoutExpired:
-                self.logger.debug("    timed out")
-                if progress:
-                    if update is None:
-                        print(".", end="")
-                        n += 1
-                        if n >= 50:
-                            print("")
-                            n = 0
-                        sys.stdout.flush()
+        interactive = sys.stdout.isatty()
+        with selectors.DefaultSelector() as selector:
+            for pipe in chunks:
+                selector.register(pipe, selectors.EVENT_READ)
+            while len(selector.get_map()) > 0:
+                events = selector.select(timeout=poll_interval)
+                if len(events) == 0:
+                    self.logger.debug("    timed out")
+                    if progress:
+                        if update is None:
+                            # Only push each dot out for someone watching; when
+                            # redirected, they are left to the normal buffering.
+                            print(".", end="", flush=interactive)
+                            n += 1
+                            if n >= 50:
+                                print("")
+                                n = 0
+                        else:
+                            update()
+                    continue
+                for key, _ in events:
+                    data = os.read(key.fd, 65536)
+                    if data == b"":
+                        selector.unregister(key.fileobj)
                     else:
-                        update()
-            else:
-                if output != "":
-                    stdout += output
-                    self.logger.debug(output)
-                if errors != "":
-                    stderr += errors
-                    self.logger.debug(f"stderr: '{errors}'")
+                        chunks[key.fileobj].append(data)
+        result = process.wait()
+        self.logger.info("    finished! result = %s", result)
+        process.stdout.close()
+        process.stderr.close()
+
+        stdout = b"".join(chunks[process.stdout]).decode(errors="replace")
+        stderr = b"".join(chunks[process.stderr]).decode(errors="replace")
+        if stdout != "":
+            self.logger.debug(stdout)
+        if stderr != "":
+            self.logger.debug("stderr: '%s'", stderr)
         if progress and newline and n > 0:
             if update is None:
                 print("")
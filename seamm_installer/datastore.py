@@ -4,23 +4,10 @@
 
 import importlib.metadata as implib
 from pathlib import Path
-import platform
 import subprocess
 
 from . import my
-
-
-system = platform.system()
-if system in ("Darwin",):
-    from .mac import ServiceManager
-
-    mgr = ServiceManager(prefix="org.molssi.seamm.")
-elif system in ("Linux",):
-    from .linux import ServiceManager
-
-    mgr = ServiceManager(prefix="org.molssi.seamm.")
-else:
-    raise NotImplementedError(f"SEAMM does not support services on {system} yet.")
+from .util import get_service_manager
 
 
 def setup(parser):
@@ -96,6 +83,7 @@ def update():
             print(f"The database at '{db_path}' is already up-to-date.")
         else:
             service_name = "dev_dashboard" if my.development else "dashboard"
+            mgr = get_service_manager(prefix="org.molssi.seamm.")
             restart = mgr.is_running(service_name)
             if restart:
                 print(f"Stopping the service {service_name}")
@@ -1,11 +1,18 @@
 import collections.abc
+import concurrent.futures
+import functools
+import importlib.resources
 import locale
 import logging
+import operator
+import os
 from pathlib import Path
-import pkg_resources
 import platform
+import queue
 import shutil
 import sys
+import threading
+import time
 import tkinter as tk
 import tkinter.ttk as ttk
 
@@ -16,13 +23,17 @@ from . import apps
 from . import datastore
 from . import my
 from .util import (
+    find_installers,
     find_packages,
     get_metadata,
+    get_service_manager,
+    invalidate_packages,
     package_info,
+    parse_version,
     run_plugin_installer,
 )
 from .services import known_services
-from .install import install_development_environment
+from .install import install_development_environment, package_services
 from .update import update_development_environment
 
 #    set_metadata,
@@ -30,27 +41,51 @@ from .update import update_development_environment
 
 system = platform.system()
 if system in ("Darwin",):
-    from .mac import ServiceManager
     from .mac import create_app, delete_app, get_apps, update_app  # noqa: F401
 
-    mgr = ServiceManager(prefix="org.molssi.seamm")
     icons = "SEAMM.icns"
 elif system in ("Linux",):
-    from .linux import ServiceManager
     from .linux import create_app, delete_app, get_apps, update_app  # noqa: F401
 
-    mgr = ServiceManager(prefix="org.molssi.seamm")
     icons = "linux_icons"
 else:
     raise NotImplementedError(f"SEAMM does not support services on {system} yet.")
 
 logger = logging.getLogger(__name__)
 
+# The number of plug-in installers to run at once. Kept modest since they may all
+# be using conda.
+_max_workers = min(16, 2 * (os.cpu_count() or 1))
+
+# How long, in seconds, to reuse the lists of apps and services. Any changes made
+# in the GUI clear them immediately.
+_cache_lifetime = 5.0
+
+# How often, in milliseconds, to check for results from the background threads.
+_poll_interval = 100
+
+# The buttons on the Components tab that are disabled while the packages refresh.
+_package_buttons = (
+    "refresh",
+    "install",
+    "install gui-only",
+    "uninstall",
+    "uninstall gui-only",
+    "update",
+    "update gui-only",
+)
+
 
 # Make some styles for coloring labels
 dk_green = "#008C00"
 red = "#D20000"
 
+# The style and text color for the status of a package
+status_style = {
+    "out of date": ("Red.TLabel", red),
+    "up to date": ("Green.TLabel", dk_green),
+}
+
 # Help text
 help_text = """\
 The SEAMM installer handles three different aspects of installing SEAMM:
@@ -103,6 +138,37 @@ The SEAMM installer handles three different aspects of installing SEAMM:
 """
 
 
+@functools.lru_cache(maxsize=None)
+def _which(name):
+    """The path to the executable, remembering both hits and misses.
+
+    The cache is cleared before creating shortcuts or services, in case the
+    executables have just been installed.
+    """
+    return shutil.which(name)
+
+
+def _tilde(path, home):
+    """The path as a string, abbreviating the home directory to '~'.
+
+    Parameters
+    ----------
+    path : pathlib.Path or str
+        The path to abbreviate.
+    home : str
+        The home directory, ending with the path separator.
+
+    Returns
+    -------
+    str
+        The path, starting with '~/' if it is in the home directory.
+    """
+    path = os.fspath(path)
+    if path.startswith(home):
+        return "~/" + path[len(home) :]
+    return path
+
+
 class GUI(collections.abc.MutableMapping):
     def __init__(self, logger=logger):
         self.dbg_level = 30
@@ -112,22 +178,53 @@ class GUI(collections.abc.MutableMapping):
         self.progress_dialog = None
         self.progress_bar = None
         self.cancel = False
-        self._selected = {}
+        self._selected = set()  # The names of the selected packages
+        self._shown = []  # The packages in the table and their checkbuttons
         self.packages = None
         self.package_data = {}
         self._gui_only = None  # Creation deferred to setup.
 
         self.app_data = {}
         self._selected_apps = {}
+        self._app_rows = {}  # The widgets in the apps table, by app
+        self._apps_cache = None  # The time and result of the last get_apps()
 
         self.service_data = {}
         self._selected_services = {}
+        self._service_rows = {}  # The widgets in the services table, by service
+        self._services_cache = None  # The time and the last service data
+        self._services_busy = False  # Whether the services are being queried or changed
+
+        # The names of the apps and services, which differ for development
+        if my.development:
+            self._app_names = {k: f"{v}-dev" for k, v in apps.app_names.items()}
+            self._service_names = {s: f"dev_{s}" for s in known_services}
+        else:
+            self._app_names = {**apps.app_names}
+            self._service_names = {s: s for s in known_services}
 
         self.metadata = get_metadata()
 
         self.tabs = {}
+        self._tab_builders = {}
+        self._last_tab = None  # The tab shown, to ignore repeated tab events
         self.descriptions = []
-        self.description_width = 0
+        self.description_width = {}
+        self._reflow_pending = False
+        self._displaylines = {}  # Wrapped line counts keyed by (id(widget), width)
+        self._icons_path = None
+        self._bg = None  # The background color of labels, found in setup
+
+        # Cached information about the installed packages, cleared by refresh
+        self._info_cache = {}
+        self._refreshing = False
+        # Calls posted by the background threads for the main thread, and the
+        # number of threads running.
+        self._queue = queue.Queue()
+        self._workers = 0
+        self._table_rows = []  # The reusable widgets for the rows of the table
+        self._row_descriptions = {}  # The description and color for each row
+        self._row_buckets = None  # The sorted rows of the table for each type
 
         self.root = self.setup()
 
@@ -155,6 +252,14 @@ class GUI(collections.abc.MutableMapping):
         """The len() command"""
         return len(self._widget)
 
+    @property
+    def icons_path(self):
+        "The path to the icons for the shortcuts."
+        if self._icons_path is None:
+            data_path = importlib.resources.files("seamm_installer") / "data"
+            self._icons_path = Path(str(data_path / icons))
+        return self._icons_path
+
     @property
     def gui_only(self):
         "Whether to install only the GUI."
@@ -238,7 +343,7 @@ class GUI(collections.abc.MutableMapping):
 
         # Get the background color
         style = ttk.Style()
-        bg = style.lookup("TLabel", "background")
+        bg = self._bg = style.lookup("TLabel", "background")
         del style
 
         self["help"] = sw.HTMLScrolledText(
@@ -254,11 +359,101 @@ class GUI(collections.abc.MutableMapping):
         nb.add(page, text="Components", sticky=tk.NSEW)
         self.tabs[str(page)] = "Components"
 
+        # Add the apps
+        page = ttk.Frame(nb)
+        nb.add(page, text="Shortcuts", sticky=tk.NSEW)
+        self.tabs[str(page)] = "Shortcuts"
+
+        # Add the services
+        page = ttk.Frame(nb)
+        nb.add(page, text="Services", sticky=tk.NSEW)
+        self.tabs[str(page)] = "Services"
+
+        # The contents of the tabs are built when they are first shown
+        self._tab_builders = {
+            "Components": self._build_components_tab,
+            "Shortcuts": self._build_shortcuts_tab,
+            "Services": self._build_services_tab,
+        }
+
+        nb.select(0)
+
+        # Work out and set the window size to nicely fit the screen
+        ws = root.winfo_screenwidth()
+        hs = root.winfo_screenheight()
+        w = int(0.9 * ws)
+        if w > 1500:
+            w = 1500
+        h = int(0.8 * hs)
+        x = int((ws - w) / 2)
+        y = int(0.2 * hs / 2)
+
+        root.geometry(f"{w}x{h}+{x}+{y}")
+
+        self.logger.debug("Finished initializing the rest of the GUI, drawing window")
+        self.logger.debug("SEAMM has been drawn. Now raise it to the top")
+
+        # bring it to the top of all windows
+        root.lift()
+
+        # Create a progress dialog
+        d = self.progress_dialog = tk.Toplevel()
+        d.transient(root)
+
+        w = self.progress_bar = ttk.Progressbar(d, orient=tk.HORIZONTAL, length=400)
+        w.grid(row=0, column=0, sticky=tk.NSEW)
+
+        w = self.progress_text = ttk.Label(d, text="Progress")
+        w.grid(row=1, column=0)
+
+        w = ttk.Button(d, text="Cancel", command=self.cancel)
+        # w.grid(row=2, column=0)
+        w.rowconfigure(0, minsize=30)
+
+        # Center
+        w = d.winfo_reqwidth()
+        h = d.winfo_reqwidth()
+        x = int((ws - w) / 2)
+        y = int((hs - h) / 2)
+
+        d.geometry(f"+{x}+{y}")
+        d.withdraw()
+
+        root.update_idletasks()
+
+        # Styles for coloring lines in table
+        style = ttk.Style()
+        style.configure("Green.TLabel", foreground=dk_green)
+        style.configure("Red.TLabel", foreground=red)
+
+        # root.after_idle(self.refresh)
+
+        return root
+
+    def _build_components_tab(self, page):
+        "Create the widgets in the Components tab."
         self["table"] = sw.ScrolledLabelFrame(page, text="SEAMM components")
         self["table"].grid(column=0, row=0, sticky=tk.NSEW)
+        self["table"].interior().bind("<Configure>", self._configure_table)
         page.rowconfigure(0, weight=1)
         page.columnconfigure(0, weight=1)
 
+        # The headers of the table
+        frame = self["table"].interior()
+        w = ttk.Label(frame, text="Version")
+        w.grid(row=0, column=3, columnspan=2)
+
+        w = ttk.Label(frame, text="Component")
+        w.grid(row=1, column=1)
+        w = ttk.Label(frame, text="Type")
+        w.grid(row=1, column=2)
+        w = ttk.Label(frame, text="Installed")
+        w.grid(row=1, column=3)
+        w = ttk.Label(frame, text="Available")
+        w.grid(row=1, column=4)
+        w = ttk.Label(frame, text="Description")
+        w.grid(row=1, column=5)
+
         # and buttons below...
         frame = self["component buttons"] = ttk.Frame(page)
         frame.grid(column=0, row=1)
@@ -297,15 +492,19 @@ class GUI(collections.abc.MutableMapping):
             command=lambda: self._update(gui_only=True),
         )
 
-        # Add the apps
-        page = ttk.Frame(nb)
-        nb.add(page, text="Shortcuts", sticky=tk.NSEW)
-        self.tabs[str(page)] = "Shortcuts"
-
+    def _build_shortcuts_tab(self, page):
+        "Create the widgets in the Shortcuts tab."
         self["apps"] = sw.ScrolledLabelFrame(page, text="SEAMM shortcuts")
         self["apps"].grid(column=0, row=0, sticky=tk.NSEW)
         page.columnconfigure(0, weight=1)
 
+        # The headers of the table
+        frame = self["apps"].interior()
+        w = ttk.Label(frame, text="Shortcut")
+        w.grid(row=0, column=1)
+        w = ttk.Label(frame, text="Location")
+        w.grid(row=0, column=2)
+
         # and buttons below...
         frame = ttk.Frame(page)
         frame.grid(column=0, row=1)
@@ -320,15 +519,25 @@ class GUI(collections.abc.MutableMapping):
         self["create apps"].grid(row=0, column=0, sticky=tk.EW)
         self["remove apps"].grid(row=0, column=1, sticky=tk.EW)
 
-        # Add the services
-        page = ttk.Frame(nb)
-        nb.add(page, text="Services", sticky=tk.NSEW)
-        self.tabs[str(page)] = "Services"
-
+    def _build_services_tab(self, page):
+        "Create the widgets in the Services tab."
         self["services"] = sw.ScrolledLabelFrame(page, text="SEAMM services")
         self["services"].grid(column=0, row=0, sticky=tk.NSEW)
         page.columnconfigure(0, weight=1)
 
+        # The headers of the table
+        frame = self["services"].interior()
+        w = ttk.Label(frame, text="Service")
+        w.grid(row=0, column=1)
+        w = ttk.Label(frame, text="Status")
+        w.grid(row=0, column=2)
+        w = ttk.Label(frame, text="Root")
+        w.grid(row=0, column=3)
+        w = ttk.Label(frame, text="Port")
+        w.grid(row=0, column=4)
+        w = ttk.Label(frame, text="Name")
+        w.grid(row=0, column=5)
+
         # and buttons below...
         frame = ttk.Frame(page)
         frame.grid(column=0, row=1)
@@ -351,60 +560,6 @@ class GUI(collections.abc.MutableMapping):
         self["start services"].grid(row=0, column=1, sticky=tk.EW)
         self["stop services"].grid(row=1, column=1, sticky=tk.EW)
 
-        nb.select(0)
-
-        # Work out and set the window size to nicely fit the screen
-        ws = root.winfo_screenwidth()
-        hs = root.winfo_screenheight()
-        w = int(0.9 * ws)
-        if w > 1500:
-            w = 1500
-        h = int(0.8 * hs)
-        x = int((ws - w) / 2)
-        y = int(0.2 * hs / 2)
-
-        root.geometry(f"{w}x{h}+{x}+{y}")
-
-        self.logger.debug("Finished initializing the rest of the GUI, drawing window")
-        self.logger.debug("SEAMM has been drawn. Now raise it to the top")
-
-        # bring it to the top of all windows
-        root.lift()
-
-        # Create a progress dialog
-        d = self.progress_dialog = tk.Toplevel()
-        d.transient(root)
-
-        w = self.progress_bar = ttk.Progressbar(d, orient=tk.HORIZONTAL, length=400)
-        w.grid(row=0, column=0, sticky=tk.NSEW)
-
-        w = self.progress_text = ttk.Label(d, text="Progress")
-        w.grid(row=1, column=0)
-
-        w = ttk.Button(d, text="Cancel", command=self.cancel)
-        # w.grid(row=2, column=0)
-        w.rowconfigure(0, minsize=30)
-
-        # Center
-        w = d.winfo_reqwidth()
-        h = d.winfo_reqwidth()
-        x = int((ws - w) / 2)
-        y = int((hs - h) / 2)
-
-        d.geometry(f"+{x}+{y}")
-        d.withdraw()
-
-        root.update_idletasks()
-
-        # Styles for coloring lines in table
-        style = ttk.Style()
-        style.configure("Green.TLabel", foreground=dk_green)
-        style.configure("Red.TLabel", foreground=red)
-
-        # root.after_idle(self.refresh)
-
-        return root
-
     def cancel(self):
         print("Cancel hit!")
         self.cancel = True
@@ -419,39 +574,133 @@ class GUI(collections.abc.MutableMapping):
     def preferences(self):
         raise NotImplementedError()
 
-    def refresh(self):
-        """Update the table of packages."""
+    def refresh(self, update_cache=False):
+        """Update the table of packages.
+
+        The packages are examined in a background thread so that the GUI stays
+        responsive, and the table is redrawn when the thread finishes.
+
+        Parameters
+        ----------
+        update_cache : bool = False
+            Whether to update the cache of available packages first.
+        """
+        if self._refreshing:
+            return
+        self._refreshing = True
+        # Nothing may change the packages while the worker is looking at them.
+        self._set_package_buttons(tk.DISABLED)
+
+        self._info_cache.clear()
+
         self.progress_bar.configure(mode="indeterminate", value=0)
         self.progress_text.configure(
             text="Finding all packages. This may take a couple minutes."
         )
         self.progress_dialog.deiconify()
-        self.root.update()
         self.progress_bar.start()
 
-        self.packages = find_packages(
-            progress=True, update=self.root.update, cache_valid=5
-        )
+        self._start_worker(self._refresh_worker, update_cache)
 
-        self.progress_bar.stop()
+    def _refresh_worker(self, update_cache):
+        """Find the packages and their status, off the main thread.
 
-        n = len(self.packages)
-        self.progress_bar.configure(mode="determinate", maximum=n, value=0)
-        self.progress_text.configure(
-            text=f"Finding which packages are installed (0 of {n})"
-        )
-        self.root.update()
-
-        installed = my.conda.list()
-
-        count = 0
-        data = self.package_data = {}
-        for package in self.packages:
-            count += 1
+        Nothing here may touch the widgets, so progress and the results are passed
+        back to the main thread with _post.
+        """
+        try:
+            packages, data = self._find_package_data(update_cache)
+        except Exception:
+            self.logger.exception("Error finding the packages.")
+            self._post(self._refresh_done, self.packages, self.package_data)
+        else:
+            self._post(self._refresh_done, packages, data)
+
+    def _start_worker(self, target, *args):
+        """Run target(*args) on a background thread.
+
+        The target must not touch the widgets, or call Tk at all, since Tcl may not
+        be thread-safe. It passes results back with _post, and the main thread runs
+        them while any worker is running.
+        """
+        self._workers += 1
+        threading.Thread(
+            target=self._run_worker, args=(target, args), daemon=True
+        ).start()
+        if self._workers == 1:
+            self.root.after(_poll_interval, self._poll_queue)
+
+    def _run_worker(self, target, args):
+        "Run the target of a background thread, and note when it is done."
+        try:
+            target(*args)
+        finally:
+            self._post(self._worker_done)
+
+    def _worker_done(self):
+        "Count a background thread as finished."
+        self._workers -= 1
+
+    def _post(self, method, *args):
+        "Have the main thread call method(*args). Safe to call from any thread."
+        self._queue.put((method, args))
+
+    def _poll_queue(self):
+        "Run the calls posted by the background threads, on the main thread."
+        while True:
+            try:
+                method, args = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            method(*args)
+        if self._workers > 0:
+            self.root.after(_poll_interval, self._poll_queue)
+
+    def _find_package_data(self, update_cache):
+        "Find the available packages and which are installed."
+        if update_cache:
+            packages = find_packages(progress=True, update_cache=True)
+        else:
+            packages = find_packages(progress=True, cache_valid=5)
+
+        n = len(packages)
+        self._post(self._start_progress, n)
+
+        installed = my.conda.list_installed()
+        installers = find_installers()
+
+        # Run the installers of the installed plug-ins concurrently, since each is
+        # a separate process.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_max_workers) as pool:
+            futures = {}
+            for package in packages:
+                if package in installed:
+                    future = pool.submit(
+                        run_plugin_installer,
+                        package,
+                        "show",
+                        verbose=False,
+                        installers=installers,
+                    )
+                    futures[future] = package
+            results = {}
+            count = n - len(futures)
+            for future in concurrent.futures.as_completed(futures):
+                package = futures[future]
+                results[package] = future.result()
+                count += 1
+                self._post(
+                    self._update_progress,
+                    count,
+                    n,
+                    f"Checking background codes ({count} / {n})",
+                )
 
-            available = self.packages[package]["version"]
-            if package in self.packages and "description" in self.packages[package]:
-                description = self.packages[package]["description"].strip()
+        data = {}
+        for package in packages:
+            available = packages[package]["version"]
+            if "description" in packages[package]:
+                description = packages[package]["description"].strip()
             else:
                 description = "description unavailable"
 
@@ -459,26 +708,21 @@ class GUI(collections.abc.MutableMapping):
                 data[package] = [package, "--", available, description, "not installed"]
             else:
                 version = installed[package]["version"]
-                # See if the package has an installer
-                self.progress_text.configure(
-                    text=f"Checking background codes for {package}."
-                )
-                self.root.update()
 
-                result = run_plugin_installer(package, "show", verbose=False)
+                result = results[package]
                 if result is not None:
                     if result.returncode == 0:
-                        for line in result.stdout.splitlines():
-                            description += f"\n{line}"
+                        lines = [description, *result.stdout.splitlines()]
                     else:
-                        description += (
-                            f"\nThe installer for {package} "
-                            f"returned code {result.returncode}"
-                        )
-                        for line in result.stderr.splitlines():
-                            description += f"\n    {line}"
-
-                if version < available:
+                        lines = [
+                            description,
+                            f"The installer for {package} "
+                            f"returned code {result.returncode}",
+                            *[f"    {line}" for line in result.stderr.splitlines()],
+                        ]
+                    description = "\n".join(lines)
+
+                if parse_version(version) < parse_version(available):
                     data[package] = [
                         package,
                         version,
@@ -495,13 +739,48 @@ class GUI(collections.abc.MutableMapping):
                         "up to date",
                     ]
 
-            self.progress_bar.step()
-            self.progress_text.configure(
-                text=f"Finding which packages are installed ({count} / {n})"
-            )
-            self.root.update()
+        return packages, data
 
+    def _start_progress(self, n):
+        "Switch the progress bar to counting the packages."
+        self.progress_bar.stop()
+        self.progress_bar.configure(mode="determinate", maximum=n, value=0)
+        self.progress_text.configure(
+            text=f"Finding which packages are installed (0 of {n})"
+        )
+
+    def _set_package_buttons(self, state):
+        "Enable or disable the buttons that refresh or change the packages."
+        for key in _package_buttons:
+            self[key].configure(state=state)
+
+    def _update_progress(self, count, n, text):
+        "Show the progress of the refresh."
+        self.progress_bar.configure(value=count)
+        self.progress_text.configure(text=text)
+
+    def _refresh_done(self, packages, data):
+        "Install the results of the refresh and redraw the table."
+        self.packages = packages
+        self.package_data = data
+        self._row_buckets = None
+        self._refreshing = False
+        self._set_package_buttons(tk.NORMAL)
         self.progress_dialog.withdraw()
+        if self.packages is not None:
+            self.reset_table()
+
+    def _package_info(self, package):
+        "The installed version and channel of a package, cached for the session."
+        if package not in self._info_cache:
+            self._info_cache[package] = package_info(package)
+        return self._info_cache[package]
+
+    def _invalidate(self, package):
+        "Forget the cached information for a package that has been changed."
+        self._info_cache.pop(package, None)
+        my.pip.invalidate(package)
+        my.conda.invalidate()
 
     def reset_table(self):
         "Redraw the table in the GUI."
@@ -510,34 +789,20 @@ class GUI(collections.abc.MutableMapping):
         table = self["table"]
         frame = table.interior()
 
-        for child in frame.grid_slaves():
-            child.destroy()
+        # Hold off resizing the table until all the rows are in place
+        frame.grid_propagate(False)
 
-        w = ttk.Label(frame, text="Version")
-        w.grid(row=0, column=3, columnspan=2)
-
-        w = ttk.Label(frame, text="Component")
-        w.grid(row=1, column=1)
-        w = ttk.Label(frame, text="Type")
-        w.grid(row=1, column=2)
-        w = ttk.Label(frame, text="Installed")
-        w.grid(row=1, column=3)
-        w = ttk.Label(frame, text="Available")
-        w.grid(row=1, column=4)
-        w = ttk.Label(frame, text="Description")
-        w.grid(row=1, column=5)
+        # The headers are made with the tab, and the rows reused between redraws
         row = 2
 
-        # Get the background color
-        style = ttk.Style()
-        bg = style.lookup("TLabel", "background")
-        del style
-
         self.descriptions = []
+        self._shown = []
 
-        for ptype in ("Core package", "MolSSI plug-in", "3rd-party plug-in"):
-            group = []
-            for m, v, a, d, status in self.package_data.values():
+        if self._row_buckets is None:
+            self._row_buckets = self._bucket_rows()
+
+        for ptype, group in self._row_buckets.items():
+            for m, v, a, d, status in group:
                 if self.gui_only and m in (
                     "seamm-dashboard",
                     "seamm-datastore",
@@ -545,46 +810,44 @@ class GUI(collections.abc.MutableMapping):
                 ):
                     continue
 
-                if self.packages[m]["type"] == ptype:
-                    group.append([m, v, a, d, status])
-
-            group.sort(key=lambda x: x[0])
-
-            for m, v, a, d, status in group:
-                if status == "out of date":
-                    style = "Red.TLabel"
-                    fg = red
-                elif status == "up to date":
-                    style = "Green.TLabel"
-                    fg = dk_green
+                style, fg = status_style.get(status, ("TLabel", "black"))
+
+                index = row - 2
+                if index == len(self._table_rows):
+                    self._table_rows.append(self._create_table_row(frame, row))
+                widgets = self._table_rows[index]
+                w = widgets["select"]
+                w.configure(command=functools.partial(self._toggle, w, m))
+                selected = "selected" if m in self._selected else "!selected"
+                w.state(["!alternate", selected])
+                self._shown.append((m, w))
+                widgets["name"].configure(text=m, style=style)
+                widgets["type"].configure(text=str(ptype), style=style)
+                widgets["installed"].configure(text=str(v), style=style)
+                widgets["available"].configure(text=str(a), style=style)
+                self._row_descriptions[index] = (d, fg)
+                w = widgets["description"]
+                if isinstance(w, tk.Text):
+                    w.configure(state=tk.NORMAL, foreground=fg)
+                    w.delete("1.0", "end")
+                    w.insert("end", d)
+                    self.descriptions.append(w)
                 else:
-                    style = "TLabel"
-                    fg = "black"
-
-                if m not in self._selected:
-                    self._selected[m] = tk.IntVar()
-                w = ttk.Checkbutton(frame, variable=self._selected[m])
-                w.grid(row=row, column=0, sticky=tk.N)
-                w = ttk.Label(frame, text=m, style=style)
-                w.grid(row=row, column=1, sticky="nw")
-                w = ttk.Label(frame, text=str(ptype), style=style)
-                w.grid(row=row, column=2, sticky=tk.N)
-                w = ttk.Label(frame, text=str(v), style=style)
-                w.grid(row=row, column=3, sticky=tk.N)
-                w = ttk.Label(frame, text=str(a), style=style)
-                w.grid(row=row, column=4, sticky=tk.N)
-                w = tk.Text(frame, wrap=tk.WORD, width=50, background=bg, foreground=fg)
-                w.insert("end", d.strip())
-                w.grid(row=row, column=5, sticky=tk.EW)
-                self.descriptions.append(w)
+                    # Only the first line until the row is scrolled into view
+                    w.configure(text=d.split("\n", maxsplit=1)[0], style=style)
+                for w in widgets.values():
+                    w.grid()
                 row += 1
 
+        # Hide any rows left over from a longer table
+        for widgets in self._table_rows[row - 2 :]:
+            for w in widgets.values():
+                w.grid_remove()
+
         frame.columnconfigure(5, weight=1)
 
         # Handle the buttons
         frame = self["component buttons"]
-        for child in frame.grid_slaves():
-            child.grid_forget()
 
         self["refresh"].grid(row=0, column=0, sticky=tk.EW)
         self["gui only"].grid(row=1, column=0, sticky=tk.EW)
@@ -593,6 +856,8 @@ class GUI(collections.abc.MutableMapping):
         self["clear selection"].grid(row=1, column=2, sticky=tk.EW)
 
         if self.gui_only:
+            for key in ("install", "uninstall", "update"):
+                self[key].grid_forget()
             self["install gui-only"].grid(row=0, column=4, sticky=tk.EW)
             self["uninstall gui-only"].grid(row=1, column=4, sticky=tk.EW)
 
@@ -611,33 +876,135 @@ class GUI(collections.abc.MutableMapping):
         frame.columnconfigure(5, minsize=15)
         frame.rowconfigure(2, minsize=15)
 
-        self.root.update()
+        # Lay out everything at once, then set the heights of the descriptions
+        table.interior().grid_propagate(True)
+        self.root.update_idletasks()
 
-        # Set the heights of the descriptions
+        # The text has changed, so the number of lines must be recounted
+        self._displaylines.clear()
         self.description_width = {}
         for w in self.descriptions:
-            w.bind("<Configure>", self._configure_text)
-            n = w.count("1.0", "end", "displaylines")[0]
+            width = w.winfo_width()
+            n = self._count_displaylines(w, width)
             w.configure(height=n, state=tk.DISABLED)
-            self.description_width[w] = w.winfo_width()
-
-    def _configure_text(self, event):
-        w = event.widget
-        width = w.winfo_width()
-        if self.description_width[w] != width:
-            n = w.count("1.0", "end", "displaylines")[0]
-            w.configure(height=n)
             self.description_width[w] = width
 
+        self._show_visible_descriptions()
+
+    def _show_visible_descriptions(self):
+        """Replace the one-line descriptions in view with the full text.
+
+        Text widgets are expensive, so they are only created for rows that have
+        been scrolled into view.
+        """
+        frame = self["table"].interior()
+        # The interior is scrolled within its parent, which is the visible area
+        clipper = frame.master
+        top = clipper.winfo_rooty()
+        bottom = top + clipper.winfo_height()
+
+        upgraded = []
+        for index, widgets in enumerate(self._table_rows[: len(self._shown)]):
+            w = widgets["description"]
+            if isinstance(w, tk.Text):
+                continue
+            y = w.winfo_rooty()
+            if y > bottom or y + w.winfo_height() < top:
+                continue
+
+            d, fg = self._row_descriptions[index]
+            w.destroy()
+            w = widgets["description"] = tk.Text(
+                frame, wrap=tk.WORD, width=50, height=1, background=self._bg
+            )
+            w.grid(row=index + 2, column=5, sticky=tk.EW)
+            w.configure(foreground=fg)
+            w.insert("end", d)
+            upgraded.append(w)
+
+        if len(upgraded) > 0:
+            self.root.update_idletasks()
+            for w in upgraded:
+                width = w.winfo_width()
+                n = self._count_displaylines(w, width)
+                w.configure(height=n, state=tk.DISABLED)
+                self.description_width[w] = width
+                self.descriptions.append(w)
+
+    def _bucket_rows(self):
+        "Sort the rows of the table into the types of packages, in order."
+        buckets = {
+            "Core package": [],
+            "MolSSI plug-in": [],
+            "3rd-party plug-in": [],
+        }
+        for m, v, a, d, status in self.package_data.values():
+            ptype = self.packages[m]["type"]
+            if ptype in buckets:
+                buckets[ptype].append([m, v, a, d.strip(), status])
+        for group in buckets.values():
+            group.sort(key=operator.itemgetter(0))
+        return buckets
+
+    def _create_table_row(self, frame, row):
+        "Create the widgets for a row of the table of packages."
+        widgets = {}
+        w = widgets["select"] = ttk.Checkbutton(frame)
+        w.grid(row=row, column=0, sticky=tk.N)
+        w = widgets["name"] = ttk.Label(frame)
+        w.grid(row=row, column=1, sticky="nw")
+        w = widgets["type"] = ttk.Label(frame)
+        w.grid(row=row, column=2, sticky=tk.N)
+        w = widgets["installed"] = ttk.Label(frame)
+        w.grid(row=row, column=3, sticky=tk.N)
+        w = widgets["available"] = ttk.Label(frame)
+        w.grid(row=row, column=4, sticky=tk.N)
+        w = widgets["description"] = ttk.Label(frame)
+        w.grid(row=row, column=5, sticky="nw")
+        return widgets
+
+    def _configure_table(self, event):
+        "Reflow the descriptions, once, after the table changes size."
+        if not self._reflow_pending:
+            self._reflow_pending = True
+            self.root.after_idle(self._reflow_descriptions)
+
+    def _reflow_descriptions(self):
+        "Set the heights of the descriptions whose width has changed."
+        self._reflow_pending = False
+        self._show_visible_descriptions()
+        for w in self.descriptions:
+            width = w.winfo_width()
+            if self.description_width.get(w) != width:
+                n = self._count_displaylines(w, width)
+                w.configure(height=n)
+                self.description_width[w] = width
+
+    def _count_displaylines(self, w, width):
+        "The number of lines in a description of a given width, cached."
+        key = (id(w), width)
+        if key not in self._displaylines:
+            self._displaylines[key] = w.count("1.0", "end", "displaylines")[0]
+        return self._displaylines[key]
+
+    def _toggle(self, w, package):
+        "Keep track of a package being selected or unselected."
+        if w.instate(["selected"]):
+            self._selected.add(package)
+        else:
+            self._selected.discard(package)
+
     def _select_all(self):
         "Select all the packages."
-        for var in self._selected.values():
-            var.set(1)
+        for package, w in self._shown:
+            self._selected.add(package)
+            w.state(["selected"])
 
     def _clear_selection(self):
         "Unselect all the packages."
-        for var in self._selected.values():
-            var.set(0)
+        self._selected.clear()
+        for package, w in self._shown:
+            w.state(["!selected"])
 
     def _select_all_apps(self):
         "Select all the apps."
@@ -659,164 +1026,159 @@ class GUI(collections.abc.MutableMapping):
         for var in self._selected_services.values():
             var.set(0)
 
+    def _selected_packages(self):
+        "The names of the selected packages."
+        return [package for package in self.package_data if package in self._selected]
+
+    def _classify(self, package, installed_version, installed_channel):
+        """What installing a package entails.
+
+        Parameters
+        ----------
+        package : str
+            The name of the package.
+        installed_version : str
+            The installed version, or None if not installed.
+        installed_channel : str
+            The channel the package was installed from, or None.
+
+        Returns
+        -------
+        str
+            "install", "update", or None if there is nothing to do.
+        """
+        if installed_channel is None:
+            return "install"
+        data = self.packages[package]
+        pinned = "pinned" in data and data["pinned"]
+        if not pinned or parse_version(installed_version) < parse_version(
+            data["version"]
+        ):
+            return "update"
+        return None
+
     def _install(self, gui_only=False):
         "Install selected packages."
-        update = True
+        if self._refreshing:
+            return
         changed = False
 
-        n = 0
-        for package, var in self._selected.items():
-            if var.get() == 1:
-                available = self.packages[package]["version"]
-                channel = self.packages[package]["channel"]
-                installed_version, installed_channel = package_info(package)
-                ptype = self.packages[package]["type"]
-
-                if installed_channel is None:
-                    n += 1
-                elif update:
-                    pinned = (
-                        "pinned" in self.packages[package]
-                        and self.packages[package]["pinned"]
-                    )
-                    if pinned and installed_version < available:
-                        n += 1
-                    else:
-                        n += 1
+        # Work out what needs doing first, looking at each package only once
+        worklist = []
+        for package in self._selected_packages():
+            installed_version, installed_channel = self._package_info(package)
+            action = self._classify(package, installed_version, installed_channel)
+            if action is not None:
+                worklist.append((package, action, installed_version, installed_channel))
+        n = len(worklist)
 
         self.progress_bar.configure(mode="determinate", maximum=n, value=0)
         self.progress_text.configure(text=f"Installing/updating packages (0 of {n})")
         self.progress_dialog.deiconify()
-        self.root.update()
+        self.root.update_idletasks()
 
-        count = 0
-        for package, var in self._selected.items():
-            if var.get() == 1:
-                available = self.packages[package]["version"]
-                channel = self.packages[package]["channel"]
-                installed_version, installed_channel = package_info(package)
-                ptype = self.packages[package]["type"]
-
-                # spec = f"{package}=={available}"
-                pinned = (
-                    "pinned" in self.packages[package]
-                    and self.packages[package]["pinned"]
-                )
-                if pinned:
-                    spec = f"{package}=={available}"
-                    print(f"pinning {package} to version {available}")
-                else:
-                    spec = package
+        # Remove any packages that are changing channel, then install the rest with
+        # one call to pip and one to conda, since each call is expensive.
+        pip_specs = []
+        conda_specs = []
+        for package, action, installed_version, installed_channel in worklist:
+            available = self.packages[package]["version"]
+            channel = self.packages[package]["channel"]
+            ptype = self.packages[package]["type"]
 
-                if installed_channel is None:
-                    print(f"Installing {ptype.lower()} {package} version {available}.")
-                    if channel == "pypi":
-                        my.pip.install(spec)
-                    else:
-                        my.conda.install(spec)
-
-                    if package == "seamm-datastore":
-                        datastore.update()
-                    elif package == "seamm-dashboard":
-                        # If installing, the service should not exist, but restart if
-                        # it does.
-                        service = f"dev_{package}" if my.development else package
-                        mgr.restart(service, ignore_errors=True)
-                    elif package == "seamm-jobserver":
-                        service = f"dev_{package}" if my.development else package
-                        mgr.restart(service, ignore_errors=True)
-                    # See if the package has an installer
-                    if not gui_only:
-                        self.progress_text.configure(
-                            text=f"Running installer for {package}"
-                        )
-                        self.root.update()
-                        run_plugin_installer(package, "install")
-
-                    # Get the actual version and patch up data
-                    tmp = my.pip.show(package)
-                    if "version" not in tmp:
-                        print(f"Could not get version for package '{package}'")
-                    else:
-                        version = tmp["version"]
-                        self.packages[package]["version"] = version
-                        m, i, a, d, status = self.package_data[package]
-                        self.package_data[package] = [
-                            m,
-                            version,
-                            version,
-                            d,
-                            "up to date",
-                        ]
-                        changed = True
+            # spec = f"{package}=={available}"
+            pinned = (
+                "pinned" in self.packages[package] and self.packages[package]["pinned"]
+            )
+            if pinned:
+                spec = f"{package}=={available}"
+                print(f"pinning {package} to version {available}")
+            else:
+                spec = package
 
-                    count += 1
-                    self.progress_bar.step()
-                    self.progress_text.configure(
-                        text=f"Installing/updating packages ({count} of {n})"
-                    )
-                    self.root.update()
-                elif update and (not pinned or installed_version < available):
-                    print(
-                        f"Updating {ptype.lower()} {package} from version "
-                        f"{installed_version} to {available}"
-                    )
-                    if channel == installed_channel:
-                        if channel == "pypi":
-                            my.pip.install(spec)
-                        else:
-                            my.conda.install(spec)
-                    else:
-                        if installed_channel == "pypi":
-                            my.pip.uninstall(package)
-                        else:
-                            my.conda.uninstall(package)
-                        if channel == "pypi":
-                            my.pip.install(spec)
-                        else:
-                            my.conda.install(spec)
-                    # See if the package has an installer
-                    if not gui_only:
-                        self.progress_text.configure(
-                            text=f"Running installer for {package}"
-                        )
-                        self.root.update()
-                        run_plugin_installer(package, "install")
-
-                    # Get the actual version and patch up data
-                    tmp = my.pip.show(package)
-                    if "version" not in tmp:
-                        print(f"Could not get version for package '{package}'")
+            if action == "install":
+                print(f"Installing {ptype.lower()} {package} version {available}.")
+            else:
+                print(
+                    f"Updating {ptype.lower()} {package} from version "
+                    f"{installed_version} to {available}"
+                )
+                if channel != installed_channel:
+                    if installed_channel == "pypi":
+                        my.pip.uninstall(package)
+                        invalidate_packages()
                     else:
-                        version = tmp["version"]
-                        m, i, a, d, status = self.package_data[package]
-                        self.package_data[package] = [
-                            m,
-                            version,
-                            a,
-                            d,
-                            "up to date",
-                        ]
-                        changed = True
+                        my.conda.uninstall(package)
+            if channel == "pypi":
+                pip_specs.append(spec)
+            else:
+                conda_specs.append(spec)
+
+        if len(pip_specs) > 0:
+            self.progress_text.configure(text="Installing packages with pip")
+            self.root.update_idletasks()
+            my.pip.install(pip_specs)
+            invalidate_packages()
+        if len(conda_specs) > 0:
+            self.progress_text.configure(text="Installing packages with conda")
+            self.root.update_idletasks()
+            my.conda.install(conda_specs)
+
+        # One listing gives the versions actually installed, by pip or conda
+        installed = my.conda.list_installed()
+
+        # If installing, the services should not exist, but restart them if they do.
+        new = {package for package, action, *_ in worklist if action == "install"}
+        if "seamm-datastore" in new:
+            datastore.update()
+        for package, service in package_services.items():
+            if package in new:
+                get_service_manager().restart(
+                    self._service_names[service], ignore_errors=True
+                )
 
-                    count += 1
-                    self.progress_bar.step()
-                    self.progress_text.configure(
-                        text=f"Installing/updating packages ({count} of {n})"
-                    )
-                    self.root.update()
+        count = 0
+        installers = None if gui_only else find_installers()
+        for package, action, installed_version, installed_channel in worklist:
+
+            # See if the package has an installer
+            if not gui_only:
+                self.progress_text.configure(text=f"Running installer for {package}")
+                self.root.update_idletasks()
+                run_plugin_installer(package, "install", installers=installers)
+
+            # Get the actual version and patch up data
+            self._invalidate(package)
+            if package not in installed:
+                print(f"Could not get version for package '{package}'")
+            else:
+                version = installed[package]["version"]
+                m, i, a, d, status = self.package_data[package]
+                if action == "install":
+                    self.packages[package]["version"] = version
+                    a = version
+                self.package_data[package] = [m, version, a, d, "up to date"]
+                changed = True
+
+            count += 1
+            self.progress_bar.step()
+            self.progress_text.configure(
+                text=f"Installing/updating packages ({count} of {n})"
+            )
+            self.root.update_idletasks()
 
         if my.development:
             # Install the development packages
             self.progress_bar.configure(mode="indeterminate", value=0)
             self.progress_text.configure(text="Installing the development environment.")
-            self.root.update()
+            self.root.update_idletasks()
             self.progress_bar.start()
 
             install_development_environment()
 
         # Fix the package list
         if changed:
+            self._row_buckets = None
             self.reset_table()
         self._clear_selection()
 
@@ -824,56 +1186,52 @@ class GUI(collections.abc.MutableMapping):
 
     def _uninstall(self, gui_only=False):
         "Uninstall selected packages."
-        n = 0
-        for package, var in self._selected.items():
-            if var.get() == 1:
-                n += 1
+        if self._refreshing:
+            return
+        worklist = self._selected_packages()
+        n = len(worklist)
 
         self.progress_bar.configure(mode="determinate", maximum=n, value=0)
         self.progress_text.configure(text=f"Uninstalling packages (0 of {n})")
         self.progress_dialog.deiconify()
-        self.root.update()
+        self.root.update_idletasks()
 
         changed = False
         count = 0
-        for package, var in self._selected.items():
-            if var.get() == 1:
-                # Run the package uninstall if it exists
-                if not gui_only:
-                    self.progress_text.configure(
-                        text=f"Running uninstaller for {package}"
-                    )
-                    self.root.update()
-                    run_plugin_installer(package, "uninstall")
-
-                # Uninstall the plug-in
-                version, channel = package_info(package)
-                ptype = self.packages[package]["type"]
-                print(f"Uninstalling {ptype.lower()} {package}")
-                if channel == "pypi":
-                    my.pip.uninstall(package)
-                else:
-                    my.conda.uninstall(package)
-                # See if the package has an installer
-                if not gui_only:
-                    self.progress_text.configure(
-                        text=f"Running uninstaller for {package}"
-                    )
-                    self.root.update()
-                    run_plugin_installer(package, "uninstall")
-
-                # Patch up data
-                m, i, a, d, status = self.package_data[package]
-                self.package_data[package] = [m, "--", a, d, "not installed"]
-                changed = True
+        for package in worklist:
+            # Run the package uninstall if it exists
+            if not gui_only:
+                self.progress_text.configure(text=f"Running uninstaller for {package}")
+                self.root.update_idletasks()
+                run_plugin_installer(package, "uninstall")
+
+            # Uninstall the plug-in
+            version, channel = self._package_info(package)
+            ptype = self.packages[package]["type"]
+            print(f"Uninstalling {ptype.lower()} {package}")
+            if channel == "pypi":
+                my.pip.uninstall(package)
+                invalidate_packages()
+            else:
+                my.conda.uninstall(package)
+            self._invalidate(package)
+            # See if the package has an installer
+            if not gui_only:
+                self.progress_text.configure(text=f"Running uninstaller for {package}")
+                self.root.update_idletasks()
+                run_plugin_installer(package, "uninstall")
+
+            # Patch up data
+            m, i, a, d, status = self.package_data[package]
+            self.package_data[package] = [m, "--", a, d, "not installed"]
+            changed = True
 
-                count += 1
-                self.progress_bar.step()
-                self.progress_text.configure(
-                    text=f"Uninstalling packages ({count} of {n})"
-                )
-                self.root.update()
+            count += 1
+            self.progress_bar.step()
+            self.progress_text.configure(text=f"Uninstalling packages ({count} of {n})")
+            self.root.update_idletasks()
         if changed:
+            self._row_buckets = None
             self.reset_table()
         self._clear_selection()
 
@@ -881,134 +1239,146 @@ class GUI(collections.abc.MutableMapping):
 
     def _update(self, gui_only=False):
         "Update the selected packages."
-        n = 0
-        for package, var in self._selected.items():
-            if var.get() == 1:
-                n += 1
+        if self._refreshing:
+            return
+        # Only the packages that are installed can be updated
+        worklist = []
+        for package in self._selected_packages():
+            installed_version, installed_channel = self._package_info(package)
+            if installed_version is not None:
+                worklist.append((package, installed_version, installed_channel))
+        n = len(worklist)
 
         self.progress_bar.configure(mode="determinate", maximum=n, value=0)
         self.progress_text.configure(text=f"Updating packages (0 of {n})")
         self.progress_dialog.deiconify()
-        self.root.update()
+        self.root.update_idletasks()
 
         changed = False
-        count = 0
-        for package, var in self._selected.items():
-            if var.get() == 1:
-                available = self.packages[package]["version"]
-                channel = self.packages[package]["channel"]
-                if "/conda-forge" in channel:
-                    print(f"{channel=} --> conda-forge")
-                    channel = "conda-forge"
-                installed_version, installed_channel = package_info(package)
-                ptype = self.packages[package]["type"]
-
-                pinned = (
-                    "pinned" in self.packages[package]
-                    and self.packages[package]["pinned"]
-                )
+
+        # Remove any packages that are changing channel, then install or update the
+        # rest with as few calls to pip and conda as possible.
+        specs = {
+            "pip install": [],
+            "pip update": [],
+            "conda install": [],
+            "conda update": [],
+        }
+        for package, installed_version, installed_channel in worklist:
+            available = self.packages[package]["version"]
+            channel = self.packages[package]["channel"]
+            if "/conda-forge" in channel:
+                print(f"{channel=} --> conda-forge")
+                channel = "conda-forge"
+            ptype = self.packages[package]["type"]
+
+            pinned = (
+                "pinned" in self.packages[package] and self.packages[package]["pinned"]
+            )
+            if pinned:
+                spec = f"{package}=={available}"
+                print(f"pinning {package} to version {available}")
+            else:
+                spec = package
+
+            print(
+                f"Updating {ptype.lower()} {package} from version "
+                f"{installed_version} to {available} using {channel} "
+                f"(was installed using {installed_channel})"
+            )
+            tool = "pip" if channel == "pypi" else "conda"
+            if channel == installed_channel:
+                self.logger.debug("    Same channel")
                 if pinned:
-                    spec = f"{package}=={available}"
-                    print(f"pinning {package} to version {available}")
+                    specs[f"{tool} install"].append(spec)
                 else:
-                    spec = package
-
-                if installed_version is not None:
-                    print(
-                        f"Updating {ptype.lower()} {package} from version "
-                        f"{installed_version} to {available} using {channel} "
-                        f"(was installed using {installed_channel})"
+                    specs[f"{tool} update"].append(spec)
+            else:
+                if installed_channel == "pypi":
+                    self.logger.debug("    uninstalling with pip")
+                    my.pip.uninstall(package)
+                    invalidate_packages()
+                else:
+                    self.logger.debug(
+                        "uninstalling '%s' '%s'", channel, installed_channel
                     )
-                    if channel == installed_channel:
-                        self.logger.debug("    Same channel")
-                        if channel == "pypi":
-                            self.logger.debug("    Updating with pip")
-                            if pinned:
-                                my.pip.install(spec)
-                            else:
-                                my.pip.update(spec)
-                        else:
-                            self.logger.debug("    Updating with conda")
-                            if pinned:
-                                my.conda.install(spec)
-                            else:
-                                my.conda.update(spec)
-                    else:
-                        if installed_channel == "pypi":
-                            self.logger.debug("    uninstalling with pip")
-                            my.pip.uninstall(package)
-                        else:
-                            print("uninstalling '{channel=}' '{installed_channel=}'")
-                            self.logger.debug(
-                                "uninstalling '{channel=}' '{installed_channel=}'"
-                            )
-                            my.conda.uninstall(package)
-                        if channel == "pypi":
-                            self.logger.debug("    installing with pip")
-                            my.pip.install(spec)
-                        else:
-                            self.logger.debug("    installing with conda")
-                            my.conda.install(spec)
-                    # See if the package has an installer
-                    if not gui_only:
-                        self.progress_text.configure(
-                            text=f"Running update for {package}"
-                        )
-                        self.root.update()
-                        run_plugin_installer(package, "update")
-
-                    # Get the actual version and patch up data
-                    tmp = my.pip.show(package)
-                    if "version" not in tmp:
-                        print(f"Could not get version for package '{package}'")
-                    else:
-                        version = tmp["version"]
-                        m, i, a, d, status = self.package_data[package]
-                        self.package_data[package] = [
-                            m,
-                            version,
-                            version,
-                            d,
-                            "up to date",
-                        ]
-                        changed = True
+                    my.conda.uninstall(package)
+                specs[f"{tool} install"].append(spec)
+
+        for key, method in (
+            ("pip install", my.pip.install),
+            ("pip update", my.pip.update),
+            ("conda install", my.conda.install),
+            ("conda update", my.conda.update),
+        ):
+            if len(specs[key]) > 0:
+                self.logger.debug("    %s %s", key, " ".join(specs[key]))
+                self.progress_text.configure(text=f"Updating packages ({key})")
+                self.root.update_idletasks()
+                method(specs[key])
+        invalidate_packages()
+
+        # One listing gives the versions actually installed, by pip or conda
+        installed = my.conda.list_installed()
 
-                    count += 1
-                    self.progress_bar.step()
-                    self.progress_text.configure(
-                        text=f"Updating packages ({count} of {n})"
-                    )
-                    self.root.update()
+        count = 0
+        installers = None if gui_only else find_installers()
+        for package, installed_version, installed_channel in worklist:
+            # See if the package has an installer
+            if not gui_only:
+                self.progress_text.configure(text=f"Running update for {package}")
+                self.root.update_idletasks()
+                run_plugin_installer(package, "update", installers=installers)
+
+            # Get the actual version and patch up data
+            self._invalidate(package)
+            if package not in installed:
+                print(f"Could not get version for package '{package}'")
+            else:
+                version = installed[package]["version"]
+                m, i, a, d, status = self.package_data[package]
+                self.package_data[package] = [m, version, version, d, "up to date"]
+                changed = True
+
+            count += 1
+            self.progress_bar.step()
+            self.progress_text.configure(text=f"Updating packages ({count} of {n})")
+            self.root.update_idletasks()
 
         if my.development:
             # Update the development packages
             self.progress_bar.configure(mode="indeterminate", value=0)
             self.progress_text.configure(text="Updating the development environment.")
-            self.root.update()
+            self.root.update_idletasks()
             self.progress_bar.start()
 
             update_development_environment()
 
         if changed:
+            self._row_buckets = None
             self.reset_table()
         self._clear_selection()
 
         self.progress_dialog.withdraw()
 
     def _create_apps(self, all_users=False):
-        installed_apps = apps.get_apps()
-        conda_exe = shutil.which("conda")
+        installed_apps = self._get_apps()
+        _which.cache_clear()
+        conda_exe = _which("conda")
         conda_path = '"' + str(my.conda.path(my.environment)) + '"'
+        packages = my.conda.list_installed()
+        icons_path = self.icons_path
+        root = my.default_root
+        messages = []
         for app_lower, var in self._selected_apps.items():
             if var.get() == 1:
                 app = apps.app_names[app_lower]
-                app_name = f"{app}-dev" if my.development else app
-                packages = my.conda.list()
+                app_name = self._app_names[app_lower]
                 package = apps.app_package[app_lower]
                 if package in packages:
                     version = str(packages[package]["version"])
                 else:
-                    print(
+                    messages.append(
                         f"The package '{package}' needed by the shortcut {app_name} is "
                         "not installed."
                     )
@@ -1016,14 +1386,8 @@ class GUI(collections.abc.MutableMapping):
                 if app_name in installed_apps:
                     continue
 
-                data_path = Path(
-                    pkg_resources.resource_filename("seamm_installer", "data/")
-                )
-                icons_path = data_path / icons
-                root = "~/SEAMM_DEV" if my.development else "~/SEAMM"
-
                 if app_lower == "dashboard":
-                    bin_path = shutil.which("seamm-dashboard")
+                    bin_path = _which("seamm-dashboard")
                     create_app(
                         bin_path,
                         "--root",
@@ -1036,7 +1400,7 @@ class GUI(collections.abc.MutableMapping):
                         icons=icons_path,
                     )
                 elif app_lower == "jobserver":
-                    bin_path = shutil.which(app.lower())
+                    bin_path = _which(app.lower())
                     create_app(
                         bin_path,
                         "--root",
@@ -1060,78 +1424,93 @@ class GUI(collections.abc.MutableMapping):
                         icons=icons_path,
                     )
                 if all_users:
-                    print(f"\nInstalled shortcut {app_name} for all users.")
+                    messages.append(f"\nInstalled shortcut {app_name} for all users.")
                 else:
-                    print(f"\nInstalled shortcut {app_name} for this user.")
+                    messages.append(f"\nInstalled shortcut {app_name} for this user.")
+        self._report(messages)
 
         self._clear_apps_selection()
+        self._apps_cache = None
         self.refresh_apps()
         self.layout_apps()
 
+    def _report(self, messages):
+        "Print the messages for the user with a single write."
+        text = "\n".join(messages)
+        if text != "":
+            sys.stdout.write(text + "\n")
+            sys.stdout.flush()
+
     def _refresh_cache(self):
         """Refresh the cache of vailable codes and reset the GUI."""
-        self.progress_bar.configure(mode="indeterminate", value=0)
-        self.progress_text.configure(
-            text="Finding all packages. This may take a couple minutes."
-        )
-        self.progress_dialog.deiconify()
-        self.root.update()
-        self.progress_bar.start()
-
-        self.packages = find_packages(
-            progress=True, update=self.root.update, update_cache=True
-        )
-
-        self.progress_bar.stop()
-
-        self.refresh()
-        self.reset_table()
-
-        self.progress_dialog.withdraw()
+        self.refresh(update_cache=True)
 
     def _remove_apps(self):
-        installed_apps = apps.get_apps()
+        installed_apps = self._get_apps()
+        messages = []
         for app_lower, var in self._selected_apps.items():
             if var.get() == 1:
-                app = apps.app_names[app_lower]
-                app_name = f"{app}-dev" if my.development else app
+                app_name = self._app_names[app_lower]
                 if app_name in installed_apps:
                     delete_app(app_name, missing_ok=True)
-                    print(f"Deleted the shortcut '{app_name}'.")
+                    messages.append(f"Deleted the shortcut '{app_name}'.")
                 else:
-                    print(f"Shortcut '{app_name}' was not installed.")
+                    messages.append(f"Shortcut '{app_name}' was not installed.")
+        self._report(messages)
         self._clear_apps_selection()
+        self._apps_cache = None
         self.refresh_apps()
         self.layout_apps()
 
     def _tab_cb(self, event):
         w = self["notebook"].select()
         tab = self.tabs[w]
+        # Tk may report the same tab more than once, which needs no refresh.
+        if tab == self._last_tab:
+            return
+        self._last_tab = tab
+        if tab in self._tab_builders:
+            self._tab_builders.pop(tab)(self["notebook"].nametowidget(w))
         if tab == "Components":
-            self.refresh()
-            self.reset_table()
+            # Let the tab draw before starting the refresh
+            self.root.after_idle(self.refresh)
         elif tab == "Shortcuts":
             self.refresh_apps()
             self.layout_apps()
         elif tab == "Services":
-            self.refresh_services()
-            self.layout_services()
+            self._start_services_refresh()
+
+    def _begin_update(self, table):
+        "Hide a table while it is rebuilt, so that it is redrawn only once."
+        table.grid_remove()
+
+    def _end_update(self, table):
+        "Show a table again after it has been rebuilt."
+        table.grid()
+        self.root.update_idletasks()
+
+    def _get_apps(self):
+        "The installed apps, reusing recent results."
+        if self._apps_cache is not None:
+            timestamp, applications = self._apps_cache
+            if time.monotonic() - timestamp < _cache_lifetime:
+                return applications
+        applications = get_apps()
+        self._apps_cache = (time.monotonic(), applications)
+        return applications
 
     def refresh_apps(self):
-        applications = get_apps()
+        applications = self._get_apps()
+
+        home = str(Path.home()) + os.sep
+        names = self._app_names
 
         data = self.app_data = {}
         for app in apps.known_apps:
             app_lower = app.lower()
-            app = apps.app_names[app_lower]
-            app_name = f"{app}-dev" if my.development else app
+            app_name = names[app_lower]
             if app_name in applications:
-                path = applications[app_name]
-                if path.is_relative_to(Path.home()):
-                    path = path.relative_to(Path.home())
-                    data[app_lower] = (app_name, "~/" + str(path))
-                else:
-                    data[app_lower] = (app_name, str(path))
+                data[app_lower] = (app_name, _tilde(applications[app_name], home))
             else:
                 data[app_lower] = (app_name, "not found")
 
@@ -1141,15 +1520,10 @@ class GUI(collections.abc.MutableMapping):
         # Sort by the plug-in names
         table = self["apps"]
         frame = table.interior()
+        self._begin_update(table)
 
-        for child in frame.grid_slaves():
-            child.destroy()
-
-        w = ttk.Label(frame, text="Shortcut")
-        w.grid(row=0, column=1)
-        w = ttk.Label(frame, text="Location")
-        w.grid(row=0, column=2)
-        row = 1
+        # The rows are created once, and then only updated
+        row = len(self._app_rows) + 1
         for app_lower, tmp in self.app_data.items():
             app, location = tmp
             if location == "not found":
@@ -1157,33 +1531,73 @@ class GUI(collections.abc.MutableMapping):
             else:
                 style = "Green.TLabel"
 
-            if app_lower not in self._selected_apps:
+            if app_lower not in self._app_rows:
                 self._selected_apps[app_lower] = tk.IntVar()
-            w = ttk.Checkbutton(frame, variable=self._selected_apps[app_lower])
-            w.grid(row=row, column=0, sticky=tk.N)
-            w = ttk.Label(frame, text=app, style=style)
-            w.grid(row=row, column=1, sticky=tk.W)
-            w = ttk.Label(frame, text=location, style=style)
-            w.grid(row=row, column=2, sticky=tk.W)
-            row += 1
+                widgets = self._app_rows[app_lower] = {}
+                w = ttk.Checkbutton(frame, variable=self._selected_apps[app_lower])
+                w.grid(row=row, column=0, sticky=tk.N)
+                w = widgets["name"] = ttk.Label(frame)
+                w.grid(row=row, column=1, sticky=tk.W)
+                w = widgets["location"] = ttk.Label(frame)
+                w.grid(row=row, column=2, sticky=tk.W)
+                row += 1
+            widgets = self._app_rows[app_lower]
+            widgets["name"].configure(text=app, style=style)
+            widgets["location"].configure(text=location, style=style)
 
-        self.root.update()
+        self._end_update(table)
 
     def refresh_services(self):
+        "Find the current state of the services."
+        self.service_data = self._find_service_data()
+
+    def _start_services_refresh(self):
+        "Find the state of the services in the background, unless already busy."
+        if self._services_busy:
+            return
+        self._services_busy = True
+        self._start_worker(self._refresh_services_worker)
+
+    def _refresh_services_worker(self):
+        "Find the state of the services off the main thread, then redraw."
+        try:
+            data = self._find_service_data()
+        except Exception:
+            self.logger.exception("Error finding the state of the services.")
+            data = None
+        self._post(self._apply_service_data, data)
+
+    def _apply_service_data(self, data):
+        "Show the state of the services found by the worker thread, if any."
+        self._services_busy = False
+        if data is not None:
+            self.service_data = data
+            self.layout_services()
+
+    def _find_service_data(self):
+        "Query the services concurrently, since each query runs commands."
+        if self._services_cache is not None:
+            timestamp, data = self._services_cache
+            if time.monotonic() - timestamp < _cache_lifetime:
+                return data
+
+        mgr = get_service_manager()
+        # Listing the services first also reads the service files for the queries
         services = mgr.list()
 
-        data = self.service_data = {}
-        for service in known_services:
-            service_name = f"dev_{service}" if my.development else service
+        names = self._service_names
+        found = [name for name in names.values() if name in services]
+        statuses = {}
+        if len(found) > 0:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(found)) as pool:
+                statuses = dict(zip(found, pool.map(mgr.status, found)))
 
+        home = str(Path.home()) + os.sep
+        data = {}
+        for service, service_name in names.items():
             if service_name in services:
-                path = Path(mgr.file_path(service_name))
-                if path.is_relative_to(Path.home()):
-                    path = path.relative_to(Path.home())
-                    data[service] = {"path": "~/" + str(path)}
-                else:
-                    data[service] = {"path": str(path)}
-                status = mgr.status(service_name)
+                data[service] = {"path": _tilde(mgr.file_path(service_name), home)}
+                status = statuses[service_name]
                 data[service]["status"] = (
                     "running" if status["running"] else "not running"
                 )
@@ -1202,27 +1616,19 @@ class GUI(collections.abc.MutableMapping):
                 data[service] = {"status": "not found"}
             data[service]["name"] = service_name
 
+        self._services_cache = (time.monotonic(), data)
+        return data
+
     def layout_services(self):
         "Redraw the services table in the GUI."
 
         # Sort by the plug-in names
         table = self["services"]
         frame = table.interior()
+        self._begin_update(table)
 
-        for child in frame.grid_slaves():
-            child.destroy()
-
-        w = ttk.Label(frame, text="Service")
-        w.grid(row=0, column=1)
-        w = ttk.Label(frame, text="Status")
-        w.grid(row=0, column=2)
-        w = ttk.Label(frame, text="Root")
-        w.grid(row=0, column=3)
-        w = ttk.Label(frame, text="Port")
-        w.grid(row=0, column=4)
-        w = ttk.Label(frame, text="Name")
-        w.grid(row=0, column=5)
-        row = 1
+        # The rows are created once, and then only updated
+        row = len(self._service_rows) + 1
         for service, tmp in self.service_data.items():
             status = tmp["status"]
             if status == "not found":
@@ -1232,56 +1638,69 @@ class GUI(collections.abc.MutableMapping):
             else:
                 style = "TLabel"
 
-            if service not in self._selected_services:
+            if service not in self._service_rows:
                 self._selected_services[service] = tk.IntVar()
-            w = ttk.Checkbutton(frame, variable=self._selected_services[service])
-            w.grid(row=row, column=0, sticky=tk.N)
-            w = ttk.Label(frame, text=tmp["name"], style=style)
-            w.grid(row=row, column=1, sticky=tk.W)
-            w = ttk.Label(frame, text=status, style=style)
-            w.grid(row=row, column=2, sticky=tk.W)
-            if status != "not found":
-                w = ttk.Label(frame, text=tmp["root"], style=style)
-                w.grid(row=row, column=3, sticky=tk.W)
-                w = ttk.Label(frame, text=tmp["port"], style=style)
-                w.grid(row=row, column=4, sticky=tk.W)
-                w = ttk.Label(frame, text=tmp["dashboard name"], style=style)
-                w.grid(row=row, column=5, sticky=tk.W)
-            row += 1
-
-        self.root.update()
+                widgets = self._service_rows[service] = {}
+                w = ttk.Checkbutton(frame, variable=self._selected_services[service])
+                w.grid(row=row, column=0, sticky=tk.N)
+                for column, key in enumerate(
+                    ("name", "status", "root", "port", "dashboard name"), start=1
+                ):
+                    w = widgets[key] = ttk.Label(frame)
+                    w.grid(row=row, column=column, sticky=tk.W)
+                row += 1
+            widgets = self._service_rows[service]
+            widgets["name"].configure(text=tmp["name"], style=style)
+            widgets["status"].configure(text=status, style=style)
+            for key in ("root", "port", "dashboard name"):
+                if status == "not found":
+                    widgets[key].grid_remove()
+                else:
+                    widgets[key].configure(text=tmp[key], style=style)
+                    widgets[key].grid()
+
+        self._end_update(table)
 
     def _create_services(self):
+        # Leave the services alone while the background thread is querying them.
+        if self._services_busy:
+            return
+        mgr = get_service_manager()
+        _which.cache_clear()
         port = 55155 if my.development else 55055
-        root = "~/SEAMM_DEV" if my.development else "~/SEAMM"
+        root = my.default_root
         tmp = platform.node()
         if tmp == "":
             tmp = "Dashboard"
         name = tmp + " Development" if my.development else tmp
+        logs_path = Path(root).expanduser() / "logs"
+        logs_path.mkdir(parents=True, exist_ok=True)
         services = mgr.list()
+        created = []
+        messages = []
         for service, var in self._selected_services.items():
             if var.get() == 1:
                 if service == "dashboard":
                     port, name = self._dashboard_parameters(port, name)
-                service_name = f"dev_{service}" if my.development else service
+                service_name = self._service_names[service]
                 if service_name in services:
                     if my.options.force:
                         mgr.delete(service_name)
                     else:
                         continue
                 # Proceed to creating the service.
-                exe_path = shutil.which(f"seamm-{service}")
+                exe_path = _which(f"seamm-{service}")
                 if exe_path is None:
-                    exe_path = shutil.which(service)
+                    exe_path = _which(service)
                 if exe_path is None:
-                    print(
+                    messages.append(
                         f"Could not find seamm-{service} or {service}. Is it installed?"
+                        "\n"
                     )
-                    print()
                     continue
 
-                stderr_path = Path(f"{root}/logs/{service}.out").expanduser()
-                stdout_path = Path(f"{root}/logs/{service}.out").expanduser()
+                # stderr and stdout both go to the same log file
+                log_path = str(logs_path / f"{service}.out")
 
                 if service == "dashboard":
                     mgr.create(
@@ -1293,8 +1712,8 @@ class GUI(collections.abc.MutableMapping):
                         root,
                         "--dashboard-name",
                         name,
-                        stderr_path=str(stderr_path),
-                        stdout_path=str(stdout_path),
+                        stderr_path=log_path,
+                        stdout_path=log_path,
                     )
                 else:
                     mgr.create(
@@ -1304,15 +1723,19 @@ class GUI(collections.abc.MutableMapping):
                         root,
                         "JobServer",
                         "--no-windows",
-                        stderr_path=str(stderr_path),
-                        stdout_path=str(stdout_path),
+                        stderr_path=log_path,
+                        stdout_path=log_path,
                     )
-                # And start it up
-                mgr.start(service_name)
-                print(f"Created and started the service {service_name}")
-        self._clear_services_selection()
-        self.refresh_services()
-        self.layout_services()
+                created.append(service_name)
+        self._report(messages)
+
+        # And start them up
+        self._run_on_services(self._start_created_service, created)
+
+    def _start_created_service(self, service_name):
+        "Start a newly created service, returning the message for the user."
+        get_service_manager().start(service_name)
+        return f"Created and started the service {service_name}"
 
     def _dashboard_parameters(self, port, name):
         "Let the user edit the parameters for the Dashboard service."
@@ -1351,49 +1774,82 @@ class GUI(collections.abc.MutableMapping):
         return port, name
 
     def _remove_services(self):
-        for service, var in self._selected_services.items():
-            if var.get() == 1:
-                service_name = f"dev_{service}" if my.development else service
-                mgr.delete(service_name)
-                print(f"The service {service_name} was deleted.")
-        self._clear_services_selection()
-        self.refresh_services()
-        self.layout_services()
+        "Delete the selected services."
+        if self._services_busy:
+            return
+        self._run_on_services(self._remove_service)
+
+    def _remove_service(self, service_name):
+        "Delete one service, returning the message for the user."
+        get_service_manager().delete(service_name)
+        return f"The service {service_name} was deleted."
 
     def _start_services(self):
-        for service, var in self._selected_services.items():
-            if var.get() == 1:
-                service_name = f"dev_{service}" if my.development else service
-                if mgr.is_running(service_name):
-                    print(f"The service '{service_name}' was already running.")
-                else:
-                    try:
-                        mgr.start(service_name)
-                    except RuntimeError as e:
-                        print(e.text)
-                    except NotImplementedError as e:
-                        print(e.text)
-                    else:
-                        print(f"The service '{service_name}' has been started.")
-        self._clear_services_selection()
-        self.refresh_services()
-        self.layout_services()
+        "Start the selected services."
+        if self._services_busy:
+            return
+        self._run_on_services(self._start_service)
+
+    def _start_service(self, service_name):
+        "Start one service, returning the message for the user."
+        mgr = get_service_manager()
+        if mgr.is_running(service_name):
+            return f"The service '{service_name}' was already running."
+        try:
+            mgr.start(service_name)
+        except (RuntimeError, NotImplementedError) as e:
+            return str(e)
+        return f"The service '{service_name}' has been started."
 
     def _stop_services(self):
-        for service, var in self._selected_services.items():
-            if var.get() == 1:
-                service_name = f"dev_{service}" if my.development else service
-                if mgr.is_running(service_name):
-                    try:
-                        mgr.stop(service_name)
-                    except RuntimeError as e:
-                        print(e.text)
-                    except NotImplementedError as e:
-                        print(e.text)
-                    else:
-                        print(f"The service '{service_name}' has been stopped.")
-                else:
-                    print(f"The service '{service_name}' was not running.")
-        self._clear_services_selection()
-        self.refresh_services()
+        "Stop the selected services."
+        if self._services_busy:
+            return
+        self._run_on_services(self._stop_service)
+
+    def _stop_service(self, service_name):
+        "Stop one service, returning the message for the user."
+        mgr = get_service_manager()
+        if not mgr.is_running(service_name):
+            return f"The service '{service_name}' was not running."
+        try:
+            mgr.stop(service_name)
+        except (RuntimeError, NotImplementedError) as e:
+            return str(e)
+        return f"The service '{service_name}' has been stopped."
+
+    def _run_on_services(self, action, service_names=None):
+        """Apply the action to the services, then redraw the table.
+
+        The services are independent, and each action runs systemctl or launchctl,
+        so they are handled concurrently.
+
+        Parameters
+        ----------
+        action : callable
+            The function taking the name of a service and returning a message.
+        service_names : [str] = None
+            The services to act on, defaulting to the selected services.
+        """
+        if service_names is None:
+            service_names = [
+                self._service_names[service]
+                for service, var in self._selected_services.items()
+                if var.get() == 1
+            ]
+        # Keep a background refresh from starting while the services change.
+        self._services_busy = True
+        try:
+            if len(service_names) > 0:
+                # Read the service files before starting the threads.
+                get_service_manager().list()
+                with concurrent.futures.ThreadPoolExecutor(
+                    max_workers=min(_max_workers, len(service_names))
+                ) as pool:
+                    self._report(pool.map(action, service_names))
+            self._clear_services_selection()
+            self._services_cache = None
+            self.refresh_services()
+        finally:
+            self._services_busy = False
         self.layout_services()
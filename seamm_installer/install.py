@@ -1,33 +1,25 @@
 # -*- coding: utf-8 -*-
 
 """Install requested components of SEAMM."""
-import platform
-
-import semver
 
 from . import datastore
 from .metadata import development_packages, development_packages_pip
 from . import my
 from .util import (
+    find_installers,
     find_packages,
     get_metadata,
+    get_service_manager,
+    invalidate_packages,
     package_info,
+    parse_version,
     run_plugin_installer,
     set_metadata,
 )
 
 
-system = platform.system()
-if system in ("Darwin",):
-    from .mac import ServiceManager
-
-    mgr = ServiceManager(prefix="org.molssi.seamm")
-elif system in ("Linux",):
-    from .linux import ServiceManager
-
-    mgr = ServiceManager(prefix="org.molssi.seamm")
-else:
-    raise NotImplementedError(f"SEAMM does not support services on {system} yet.")
+# The services run by packages, which are restarted when the package is installed.
+package_services = {"seamm-dashboard": "dashboard", "seamm-jobserver": "jobserver"}
 
 
 def setup(parser):
@@ -109,12 +101,20 @@ def install_packages(to_install, update=False, third_party=False):
                 p for p, d in packages.items() if "3rd-party" not in d["type"]
             ]
 
+    # Find what is installed. The lookups share one cached listing from each of
+    # conda and pip, so they are cheap once the first has been made.
+    installed = {p: package_info(p) for p in to_install if p != "development"}
+
+    # Work out what to do, removing packages that are changing between pip and conda
+    pip_specs = []
+    conda_specs = []
+    new = []
     for package in to_install:
         if package == "development":
             continue
         available = packages[package]["version"]
         channel = packages[package]["channel"]
-        installed_version, installed_channel = package_info(package)
+        installed_version, installed_channel = installed[package]
         ptype = packages[package]["type"]
 
         pinned = "pinned" in packages[package] and packages[package]["pinned"]
@@ -126,42 +126,49 @@ def install_packages(to_install, update=False, third_party=False):
 
         if installed_channel is None:
             print(f"Installing {ptype.lower()} {package} version {available}.")
-            if channel == "pypi":
-                my.pip.install(spec)
-            else:
-                my.conda.install(spec)
-
-            if package == "seamm-datastore":
-                datastore.update()
-            elif package == "seamm-dashboard":
-                # If installing, the service should not exist, but restrt if it does.
-                service = f"dev_{package}" if my.development else package
-                mgr.restart(service, ignore_errors=True)
-            elif package == "seamm-jobserver":
-                service = f"dev_{package}" if my.development else package
-                mgr.restart(service, ignore_errors=True)
-        elif update and semver.compare(installed_version, available) < 0:
+            new.append(package)
+        elif update and parse_version(installed_version) < parse_version(available):
             print(
                 f"Updating {ptype.lower()} {package} from version {installed_version} "
                 f"to {available}"
             )
-            if channel == installed_channel:
-                if channel == "pypi":
-                    my.pip.install(spec)
-                else:
-                    my.conda.install(spec)
-            else:
+            if channel != installed_channel:
                 if installed_channel == "pypi":
                     my.pip.uninstall(package)
+                    invalidate_packages()
                 else:
                     my.conda.uninstall(package)
-                if channel == "pypi":
-                    my.pip.install(spec)
-                else:
-                    my.conda.install(spec)
-        # See if the package has an installer
-        if not metadata["gui-only"]:
-            run_plugin_installer(package, "install")
+        else:
+            continue
+
+        if channel == "pypi":
+            pip_specs.append(spec)
+        else:
+            conda_specs.append(spec)
+
+    # Install everything with one call to each of pip and conda
+    if len(pip_specs) > 0:
+        my.pip.install(pip_specs)
+        invalidate_packages()
+    if len(conda_specs) > 0:
+        my.conda.install(conda_specs)
+
+    if "seamm-datastore" in new:
+        datastore.update()
+    # If installing, the services should not exist, but restart them if they do.
+    for package, service in package_services.items():
+        if package in new:
+            service = f"dev_{service}" if my.development else service
+            get_service_manager().restart(service, ignore_errors=True)
+
+    # See if the packages have installers. These are run one at a time, since they
+    # may themselves install into conda environments. Everything is installed by
+    # now, so the PATH only needs searching once.
+    if not metadata["gui-only"]:
+        installers = find_installers()
+        for package in to_install:
+            if package != "development":
+                run_plugin_installer(package, "install", installers=installers)
 
 
 def install_development_environment():
@@ -173,3 +180,4 @@ def install_development_environment():
     packages = [*development_packages_pip]
     print(f"Installing PyPI development packages {' '.join(packages)}")
     my.pip.install(packages)
+    invalidate_packages()
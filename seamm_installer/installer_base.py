@@ -7,9 +7,15 @@ from pathlib import Path
 import shutil
 
 import seamm_installer
+from . import _logconfig
 
 logger = logging.getLogger(__name__)
 
+# The meaning of the first letter of the answer to a yes/no question, and the
+# prompt for each default answer.
+yes_no_answers = {"y": True, "n": False}
+yes_no_prompts = {None: "y/n", "yes": "[y]/n", "no": "y/[n]"}
+
 prolog = """\
 # Configuration options for SEAMM.
 #
@@ -125,28 +131,15 @@ class InstallerBase(object):
         bool
             True for yes; False, no
         """
-        if default is None:
-            answer = input(f"{text} y/n: ")
-        elif default == "yes":
-            answer = input(f"{text} [y]/n: ")
-        elif default == "no":
-            answer = input(f"{text} y/[n]: ")
-        else:
-            answer = input(f"{text} y/n: ")
+        answer = input(f"{text} {yes_no_prompts.get(default, 'y/n')}: ")
+        if default in ("yes", "no"):
+            default = default[0]
 
         while True:
-            if len(answer) == 0:
-                if default == "yes":
-                    return True
-                elif default == "no":
-                    return False
-            else:
-                answer = answer[0].lower()
-                if answer == "y":
-                    return True
-                elif answer == "n":
-                    return False
-            input("Please answer 'y' or 'n': ")
+            key = answer[:1].lower() if len(answer) > 0 else default
+            if key in yes_no_answers:
+                return yes_no_answers[key]
+            answer = input("Please answer 'y' or 'n': ")
 
     def _check_ini_file(self, ini_file):
         """Ensure that the ini file exists.
@@ -224,20 +217,20 @@ class InstallerBase(object):
 
         # Is there a valid -path?
         self.logger.debug(
-            "Checking for the executable in the initial path " f"{initial_exe_path}."
+            "Checking for the executable in the initial path %s.", initial_exe_path
         )
         if initial_exe_path is None or not self.have_executables(initial_exe_path):
             exe_path = None
         else:
             exe_path = initial_exe_path
-        self.logger.debug(f"initial-exe-path = {initial_exe_path}.")
+        self.logger.debug("initial-exe-path = %s.", initial_exe_path)
 
         # Is there an installation indicated?
         if initial_installation in ("conda", "modules", "local", "docker"):
             installation = initial_installation
         else:
             installation = None
-        self.logger.debug(f"initial-installation = {initial_installation}.")
+        self.logger.debug("initial-installation = %s.", initial_installation)
 
         if installation == "conda":
             # Is there a conda environment?
@@ -293,7 +286,7 @@ class InstallerBase(object):
                 # Have a Conda environment!
                 conda_path = self.conda.path(initial_conda_environment) / "bin"
                 self.logger.debug(
-                    f"Checking for executable in conda-path: {conda_path}."
+                    "Checking for executable in conda-path: %s.", conda_path
                 )
                 if self.have_executables(conda_path):
                     # All is good!
@@ -490,9 +483,9 @@ class InstallerBase(object):
         for executable in self.executables:
             tmp_path = path / executable
             if not tmp_path.exists():
-                self.logger.debug(f"Did not find {executable} in {path}")
+                self.logger.debug("Did not find %s in %s", executable, path)
                 return False
-        self.logger.debug(f"Found all executables in {path}")
+        self.logger.debug("Found all executables in %s", path)
         return True
 
     def executables_in_path(self):
@@ -559,8 +552,8 @@ class InstallerBase(object):
         parser.add_argument(
             "--log-level",
             default="WARNING",
-            type=str.upper,
-            choices=["NOTSET", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+            type=_logconfig.log_level,
+            metavar=_logconfig.LOG_LEVEL_METAVAR,
             help=("The level of informational output, defaults to " "'%(default)s'"),
         )
         parser.add_argument(
@@ -603,10 +596,10 @@ class InstallerBase(object):
 
         # Set up the logging
         level = self.options.log_level
-        logging.basicConfig(level=level)
+        _logconfig.configure(level)
         # Don't know why basicConfig doesn't seem to work!
         self.logger.setLevel(level)
-        self.logger.info(f"Logging level is {level}")
+        self.logger.info("Logging level is %s", level)
 
         return parser
 
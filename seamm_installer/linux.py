@@ -11,32 +11,38 @@ import os
 from pathlib import Path
 import shlex
 import shutil
-from string import Template
 import subprocess
 
+from .util import write_file
+
 logger = logging.getLogger(__name__)
 
-app_text = """\
+# The user's home directory, which the fixed paths below are relative to.
+home_path = Path.home()
+
+
+# The templates for the files, which are filled in with str.format.
+app_template = """\
 [Desktop Entry]
 # The version of the desktop entry specification to which this file complies
 Version=1.5
 
 Type=Application
-Name=${name}
-Comment=${comment}
-Exec=${exe}
-Icon=${icon}
+Name={name}
+Comment={comment}
+Exec={exe}
+Icon={icon}
 Terminal=false
 SingleMainWindow=true
 Categories=Education;Science;Chemistry;Physics
 """
 
-user_text = """\
+user_template = """\
 [Unit]
-Description=${description}
+Description={description}
 [Service]
-WorkingDirectory=${wd}
-ExecStart=${exe}
+WorkingDirectory={wd}
+ExecStart={exe}
 Type=simple
 TimeoutStopSec=10
 Restart=on-failure
@@ -45,13 +51,13 @@ RestartSec=5
 WantedBy=default.target
 """
 
-service_text = """\
+service_template = """\
 [Unit]
-Description=${description}
+Description={description}
 [Service]
-User=${username}
-WorkingDirectory=${wd}
-ExecStart=${exe}
+User={username}
+WorkingDirectory={wd}
+ExecStart={exe}
 Type=simple
 TimeoutStopSec=10
 Restart=on-failure
@@ -61,6 +67,25 @@ WantedBy=multi-user.target
 """
 
 
+def _run(cmd):
+    """Run a command directly, capturing its output.
+
+    With no shell, no input and no preexec function, subprocess can start the
+    command with vfork or posix_spawn rather than copying this process.
+
+    Parameters
+    ----------
+    cmd : [str]
+        The command and its arguments.
+
+    Returns
+    -------
+    subprocess.CompletedProcess
+        The result of running the command.
+    """
+    return subprocess.run(cmd, stdin=subprocess.DEVNULL, text=True, capture_output=True)
+
+
 def list_to_dict(lst):
     res_dct = {lst[i]: lst[i + 1] for i in range(0, len(lst), 2)}
     return res_dct
@@ -93,13 +118,13 @@ def create_app(
         Other keywords arguments for compatibility with other OS's. Ignored
     """
     if user_only:
-        applications_path = Path("~/.local/share/applications/").expanduser()
+        applications_path = home_path / ".local" / "share" / "applications"
         applications_path.mkdir(mode=0o755, parents=True, exist_ok=True)
     else:
         applications_path = Path("/usr/local/share/applications/")
 
     # And put the icons in place
-    icons_path = Path("~/.local/share/icons/hicolor/").expanduser()
+    icons_path = home_path / ".local" / "share" / "icons" / "hicolor"
     path = Path(icons).expanduser().resolve()
     for icon in path.iterdir():
         dimensions = icon.stem
@@ -109,14 +134,14 @@ def create_app(
             shutil.copyfile(icon, directory / f"{name}.png")
 
     # And the desktop file itself.
-    desktop = Template(app_text).substitute(
+    desktop = app_template.format(
         name=name,
         comment=comment,
         exe=exe_path,
         icon=name,
     )
     desktop_path = applications_path / f"{name}.desktop"
-    desktop_path.write_text(desktop)
+    write_file(desktop_path, desktop)
 
 
 def delete_app(name, missing_ok=False):
@@ -145,7 +170,7 @@ def get_apps():
         Dictionary of app names and paths to the desktop file.
     """
     paths = (
-        Path("~/.local/share/applications/").expanduser(),
+        home_path / ".local" / "share" / "applications",
         Path("/usr/local/share/applications/"),
     )
     apps = {}
@@ -191,7 +216,7 @@ class ServiceManager:
         self._data = None  # Dictionary of existing services
         self._uid = os.getuid()
         self._paths = (
-            (Path("~/.config/systemd/user").expanduser(), "user"),
+            (home_path / ".config" / "systemd" / "user", "user"),
             (Path("/etc/systemd/user"), "all users"),
             (Path("/etc/systemd/system"), "system"),
         )
@@ -216,6 +241,16 @@ class ServiceManager:
     def uid(self):
         return self._uid
 
+    def _systemctl(self, domain, *args):
+        """The arguments to run systemctl for a service in the given domain.
+
+        The command is run directly rather than through the shell, which saves
+        starting a shell for each call.
+        """
+        if "user" in domain:
+            return ["systemctl", "--user", *args]
+        return ["systemctl", *args]
+
     def create(
         self,
         name,
@@ -288,7 +323,7 @@ class ServiceManager:
         if "--root" in arguments:
             root_path = Path(arguments["--root"]).expanduser()
         else:
-            root_path = Path("~/SEAMM").expanduser()
+            root_path = home_path / "SEAMM"
 
         wd_path = root_path / "services"
         wd_path.mkdir(mode=0o755, parents=True, exist_ok=True)
@@ -299,19 +334,19 @@ class ServiceManager:
             cmd += " "
             cmd += " ".join(program_arguments)
 
-        # And the service file
+        # And the service file. System-wide daemons run as the user who is
+        # installing them, which under sudo is SUDO_USER rather than root.
         if user_agent:
-            service = Template(user_text).substitute(
+            service = user_template.format(
                 description=description,
                 wd=str(wd_path),
                 exe=cmd,
             )
         else:
-            # System-wide daemons need the username
-            username = getpass.getuser()
-            service = Template(user_text).substitute(
+            username = os.environ.get("SUDO_USER") or getpass.getuser()
+            service = service_template.format(
                 description=description,
-                user=username,
+                username=username,
                 wd=str(wd_path),
                 exe=cmd,
             )
@@ -321,9 +356,9 @@ class ServiceManager:
 
         # Write the file ... we may not have permission, so catch that.
         try:
-            service_path.write_text(service)
+            write_file(service_path, service)
         except PermissionError:
-            downloads = Path("~/Downloads").expanduser()
+            downloads = home_path / "Downloads"
             downloads.mkdir(exist_ok=True)
             path = downloads / f"{name}.service"
             path.write_text(service)
@@ -372,12 +407,9 @@ class ServiceManager:
         services = self.list()
         if service in services:
             domain, service_target, path = self.data[service]
-            if "user" in domain:
-                cmd = f"systemctl --user is-active {service_target}"
-            else:
-                cmd = f"systemctl is-active {service_target}"
+            cmd = self._systemctl(domain, "is-active", service_target)
 
-            result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+            result = _run(cmd)
 
             if result.returncode == 0:
                 result = True
@@ -399,11 +431,8 @@ class ServiceManager:
             services = self.list()
             if service in services:
                 domain, service_target, path = self.data[service]
-                if "user" in domain:
-                    cmd = f"systemctl --user --now enable {path}"
-                else:
-                    cmd = f"systemctl --now enable {path}"
-                result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+                cmd = self._systemctl(domain, "--now", "enable", str(path))
+                result = _run(cmd)
                 if result.returncode != 0 and not ignore_errors:
                     raise RuntimeError(
                         f"Starting the service '{service}' was not successful:\n"
@@ -449,20 +478,14 @@ class ServiceManager:
             domain, service_target, path = self.data[service]
             # Check if it is running
             if self.is_running(service):
-                if "user" in domain:
-                    cmd = f"systemctl --user disable {service_target}"
-                else:
-                    cmd = f"systemctl disable {service_target}"
-                result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+                cmd = self._systemctl(domain, "disable", service_target)
+                result = _run(cmd)
                 if result.returncode == 0:
                     pass
                 elif not ignore_errors:
                     raise RuntimeError(f"Could not stop the service '{service}':")
-                if "user" in domain:
-                    cmd = f"systemctl --user stop {service_target}"
-                else:
-                    cmd = f"systemctl stop {service_target}"
-                result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+                cmd = self._systemctl(domain, "stop", service_target)
+                result = _run(cmd)
                 if result.returncode == 0:
                     pass
                 elif not ignore_errors:
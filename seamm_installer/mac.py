@@ -14,8 +14,62 @@ import plistlib
 import shutil
 import subprocess
 
+from .util import write_file
+
 logger = logging.getLogger(__name__)
 
+# The user's home directory, which the fixed paths below are relative to.
+home_path = Path.home()
+
+# The directories for apps for this user and for all users.
+user_applications_path = home_path / "Applications"
+applications_path = Path("/Applications")
+
+
+# The fixed entries in the Info.plist for apps and the plist for launchd services.
+# Only the entries that vary are filled in for each app or service.
+app_plist = {
+    "CFBundleDevelopmentRegion": "en",
+    "CFBundlePackageType": "APPL",
+    "LSApplicationCategoryType": "public.app-category.education",
+}
+service_plist = {
+    "KeepAlive": True,
+    "ProcessType": "Interactive",
+}
+
+
+def _run(cmd):
+    """Run launchctl or another command without a shell or stdin.
+
+    Parameters
+    ----------
+    cmd : [str]
+        The command and its arguments.
+
+    Returns
+    -------
+    subprocess.CompletedProcess
+        The result of running the command.
+    """
+    return subprocess.run(cmd, stdin=subprocess.DEVNULL, text=True, capture_output=True)
+
+
+def _running(service_target):
+    """Whether a launchd service is loaded and running.
+
+    Parameters
+    ----------
+    service_target : str
+        The service target, e.g. 'gui/501/org.molssi.seamm.dashboard'.
+
+    Returns
+    -------
+    bool
+        True if the service is running.
+    """
+    return _run(["launchctl", "print", service_target]).returncode == 0
+
 
 def create_app(
     exe_path,
@@ -54,46 +108,41 @@ def create_app(
         copyright = f"Copyright 2017-{year} MolSSI"
 
     if user_only:
-        applications_path = Path("~/Applications").expanduser()
+        app_path = user_applications_path / (name + ".app")
     else:
-        applications_path = Path("/Applications")
+        app_path = applications_path / (name + ".app")
 
-    contents_path = applications_path / (name + ".app") / "Contents"
-    contents_path.mkdir(mode=0o755, parents=True, exist_ok=True)
+    # Creating MacOS also creates the bundle and Contents directories.
+    contents_path = app_path / "Contents"
+    macos_path = contents_path / "MacOS"
+    resources_path = contents_path / "Resources"
+    macos_path.mkdir(mode=0o755, parents=True, exist_ok=True)
+    resources_path.mkdir(mode=0o755, exist_ok=True)
 
     # Create the script to run the executable
-    macos_path = contents_path / "MacOS"
-    macos_path.mkdir(mode=0o755, parents=False, exist_ok=True)
     script_path = macos_path / name
-    path = Path(exe_path).expanduser().resolve()
-    cmd = '"' + str(path) + '"'
+    exe_path = Path(exe_path).expanduser().resolve()
+    cmd = '"' + str(exe_path) + '"'
     for arg in args:
         cmd += f" {arg}"
-    script_path.write_text(f"#!/bin/bash\n{cmd}\n")
-    script_path.chmod(0o755)
+    write_file(script_path, f"#!/bin/bash\n{cmd}\n".encode(), mode=0o755)
 
-    # And put the icons in place
-    resources_path = contents_path / "Resources"
-    resources_path.mkdir(mode=0o755, parents=False, exist_ok=True)
+    # And put the icons in place. copyfile uses fcopyfile on macOS, so the copy is
+    # done by the kernel without passing through Python's buffers.
     icons_path = resources_path / (name + ".icns")
-    path = Path(icons).expanduser().resolve()
-    shutil.copyfile(path, icons_path)
+    shutil.copyfile(Path(icons).expanduser().resolve(), icons_path)
 
     # write the PList file describing the app.
     data = {
+        **app_plist,
         "CFBundleIdentifier": identifier,
         "CFBundleName": name,
         "CFBundleShortVersionString": version,
         "CFBundleExecutable": name,
         "CFBundleIconFile": icons_path.name,
-        "CFBundleDevelopmentRegion": "en",
-        "CFBundlePackageType": "APPL",
-        "LSApplicationCategoryType": "public.app-category.education",
         "NSHumanReadableCopyright": copyright,
     }
-    plist_path = contents_path / "Info.plist"
-    with plist_path.open(mode="wb") as fd:
-        plistlib.dump(data, fd)
+    write_file(contents_path / "Info.plist", plistlib.dumps(data))
 
 
 def delete_app(name, missing_ok=False):
@@ -114,12 +163,8 @@ def delete_app(name, missing_ok=False):
 
 
 def get_apps():
-    paths = (
-        Path("~/Applications").expanduser(),
-        Path("/Applications"),
-    )
     apps = {}
-    for path in paths:
+    for path in (user_applications_path, applications_path):
         for file_path in path.glob("*.app"):
             name = file_path.stem
             apps[name] = file_path
@@ -138,17 +183,18 @@ def update_app(name, version, missing_ok=False):
     missing_ok : bool = False
         Don't throw an error if the app does not exist.
     """
-    apps = get_apps()
-    if name in apps:
-        app_path = Path(apps[name])
-        contents_path = app_path / "Contents"
-        plist_path = contents_path / "Info.plist"
-        with plist_path.open(mode="rb") as fd:
-            data = plistlib.load(fd)
-        data["CFBundleShortVersionString"] = version
-        with plist_path.open(mode="wb") as fd:
-            plistlib.dump(data, fd)
-    elif not missing_ok:
+    # Look for the app directly rather than listing all the applications. As in
+    # get_apps, an app for all users takes precedence.
+    for path in (applications_path, user_applications_path):
+        plist_path = path / f"{name}.app" / "Contents" / "Info.plist"
+        if plist_path.exists():
+            data = plistlib.loads(plist_path.read_bytes())
+            # Only rewrite the file if the version has changed.
+            if data.get("CFBundleShortVersionString") != version:
+                data["CFBundleShortVersionString"] = version
+                write_file(plist_path, plistlib.dumps(data))
+            return
+    if not missing_ok:
         raise FileNotFoundError(f"App '{name}' does not exist.")
 
 
@@ -165,7 +211,7 @@ class ServiceManager:
         self._data = None  # Dictionary of existing services
         self._uid = os.getuid()
         self._paths = (
-            (Path("~/Library/LaunchAgents").expanduser(), f"gui/{self.uid}"),
+            (home_path / "Library" / "LaunchAgents", f"gui/{self.uid}"),
             (Path("/Library/LaunchAgents"), f"gui/{self.uid}"),
             (Path("/Library/LaunchDaemons"), "system"),
         )
@@ -174,9 +220,21 @@ class ServiceManager:
     def data(self):
         if self._data is None:
             self._data = {}
-            pattern = self.prefix + ".*"
+            # Read each directory once, only making paths for our plist files.
+            start = self.prefix + "."
             for path, domain in self.paths:
-                for file_path in path.glob(pattern):
+                try:
+                    with os.scandir(path) as entries:
+                        names = [
+                            entry.name
+                            for entry in entries
+                            if entry.name.startswith(start)
+                            and entry.name.endswith(".plist")
+                        ]
+                except FileNotFoundError:
+                    continue
+                for filename in names:
+                    file_path = path / filename
                     name = file_path.stem
                     target = f"{domain}/{name}"
                     short_name = file_path.suffixes[-2][1:]
@@ -239,24 +297,20 @@ class ServiceManager:
         identifier = self.prefix + "." + name
 
         if user_agent:
-            if user_only:
-                launchd_path = self.paths[0][0]
-                plist_path = launchd_path / f"{identifier}.plist"
-            else:
-                launchd_path = self.paths[1][0]
-                plist_path = launchd_path / f"{identifier}.plist"
+            launchd_path = self.paths[0 if user_only else 1][0]
         else:
             launchd_path = self.paths[2][0]
-            plist_path = launchd_path / f"{identifier}.plist"
+        plist_path = launchd_path / f"{identifier}.plist"
 
         if plist_path.exists():
             if not exist_ok:
                 raise FileExistsError()
 
+        log_path = home_path / "SEAMM" / "logs" / f"{name}.out"
         if stderr_path is None:
-            stderr_path = Path(f"~/SEAMM/logs/{name}.out").expanduser()
+            stderr_path = log_path
         if stdout_path is None:
-            stdout_path = Path(f"~/SEAMM/logs/{name}.out").expanduser()
+            stdout_path = log_path
 
         # And the plist file itself.
         program_arguments = [str(exe_path)]
@@ -264,10 +318,9 @@ class ServiceManager:
             program_arguments.append(str(arg))
 
         plist = {
+            **service_plist,
             "Label": identifier,
-            "KeepAlive": True,
             "ProgramArguments": program_arguments,
-            "ProcessType": "Interactive",
             "StandardErrorPath": str(stderr_path),
             "StandardOutPath": str(stdout_path),
         }
@@ -283,12 +336,10 @@ class ServiceManager:
         # Write the file ... we may not have permission, so catch that.
         try:
             launchd_path.mkdir(parents=True, exist_ok=True)
-            with plist_path.open(mode="wb") as fd:
-                plistlib.dump(plist, fd)
+            write_file(plist_path, plistlib.dumps(plist))
         except PermissionError:
-            path = Path("~/Downloads").expanduser() / f"{identifier}.plist"
-            with path.open(mode="wb") as fd:
-                plistlib.dump(plist, fd)
+            path = home_path / "Downloads" / f"{identifier}.plist"
+            write_file(path, plistlib.dumps(plist))
             print(f"\nYou do not have permission to write to {launchd_path}.")
             print("If you have administrator access, run the following commands:")
             print("")
@@ -311,9 +362,8 @@ class ServiceManager:
         services = self.list()
         if service in services:
             domain, service_target, path = self.data[service]
-            # Check if it is running
-            if self.is_running(service):
-                self.stop(service)
+            # Stop it if it is running; stop() checks that itself.
+            self.stop(service)
             # Now remove the files
             path.unlink(missing_ok=True)
             # Fix up service data
@@ -335,58 +385,75 @@ class ServiceManager:
         return service in self.list()
 
     def is_running(self, service):
-        result = False
         services = self.list()
         if service in services:
-            service_target = self.data[service][1]
-            cmd = f"launchctl print {service_target}"
-
-            result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
-
-            if result.returncode == 0:
-                result = True
-            else:
-                result = False
-        else:
-            result = False
-        return result
+            return _running(self.data[service][1])
+        return False
 
     def list(self):
         return self.data.keys()
 
     def restart(self, service, ignore_errors=False):
-        self.stop(service, ignore_errors=ignore_errors)
-        self.start(service, ignore_errors=ignore_errors)
+        """Restart a service.
 
-    def start(self, service, ignore_errors=False):
-        if not self.is_running(service):
-            services = self.list()
-            if service in services:
-                domain, service_target, path = self.data[service]
+        A loaded service is restarted in place with 'launchctl kickstart -k', which
+        does not reread its plist. After rewriting the plist, e.g. with
+        create(..., exist_ok=True), use stop() and start() instead so that launchd
+        loads the new file.
 
-                cmd = f"launchctl bootstrap {domain} {path}"
-                result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+        Parameters
+        ----------
+        service : str
+            The name of the service, e.g. 'dashboard'.
+        ignore_errors : bool = False
+            Whether to ignore any errors rather than raising RuntimeError.
+        """
+        services = self.list()
+        if service not in services:
+            if not ignore_errors:
+                raise RuntimeError(
+                    f"Service '{service}' cannot be started because it is not installed"
+                )
+            return
+        domain, service_target, path = self.data[service]
+
+        # A loaded service can be restarted in place with one call.
+        result = _run(["launchctl", "kickstart", "-k", service_target])
+        if result.returncode == 0:
+            return
+
+        # Otherwise unload it, which fails harmlessly if it is not loaded, and load it.
+        _run(["launchctl", "bootout", service_target])
+        result = _run(["launchctl", "bootstrap", domain, str(path)])
+        if result.returncode != 0 and not ignore_errors:
+            raise RuntimeError(
+                f"Starting the service '{service}' was not successful:\n"
+                f"{result.stderr}"
+            )
+
+    def start(self, service, ignore_errors=False):
+        services = self.list()
+        if service in services:
+            domain, service_target, path = self.data[service]
+            if not _running(service_target):
+                cmd = ["launchctl", "bootstrap", domain, str(path)]
+                result = _run(cmd)
                 if result.returncode != 0 and not ignore_errors:
                     raise RuntimeError(
                         f"Starting the service '{service}' was not successful:\n"
                         f"{result.stderr}"
                     )
-            elif not ignore_errors:
-                raise RuntimeError(
-                    f"Service '{service}' cannot be started because it is not installed"
-                )
+        elif not ignore_errors:
+            raise RuntimeError(
+                f"Service '{service}' cannot be started because it is not installed"
+            )
 
     def status(self, service):
         status = {"service": service}
         services = self.list()
         if service in services:
             status["exists"] = True
-            service_target = self.data[service][1]
-            cmd = f"launchctl print {service_target}"
-
-            result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
-
-            status["running"] = result.returncode == 0
+            status["running"] = _running(self.data[service][1])
 
             # Get the root directory and, for the dashboard, port
             path = self.data[service][2]
@@ -418,9 +485,9 @@ class ServiceManager:
         if service in services:
             domain, service_target, path = self.data[service]
             # Check if it is running
-            if self.is_running(service):
-                cmd = f"launchctl bootout {service_target}"
-                result = subprocess.run(cmd, shell=True, text=True, capture_output=True)
+            if _running(service_target):
+                cmd = ["launchctl", "bootout", service_target]
+                result = _run(cmd)
                 if result.returncode == 0:
                     pass
                 elif not ignore_errors:
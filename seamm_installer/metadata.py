@@ -42,13 +42,16 @@ molssi_plug_ins = (
 )
 external_plug_ins = []
 
-excluded_plug_ins = (
-    "chemical-formula",
-    "cms-plots",
-    "seamm-dashboard-client",
-    "seamm-cookiecutter",
-    "cassandra-step",
-    "solvate-step",
+# Only used to test membership, so a set rather than an ordered tuple.
+excluded_plug_ins = frozenset(
+    (
+        "chemical-formula",
+        "cms-plots",
+        "seamm-dashboard-client",
+        "seamm-cookiecutter",
+        "cassandra-step",
+        "solvate-step",
+    )
 )
 development_packages = (
     "black",
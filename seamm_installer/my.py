@@ -1,6 +1,7 @@
 """Global module for passing around objects and constants."""
 
 conda = None
+default_root = None
 development = None
 environment = None
 logger = None
@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
+import json
 import logging
 import pprint
 import re
 import subprocess
 
-import requests
+from packaging.utils import canonicalize_name
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +33,25 @@ class Pip(object):
 
         self._base_url = "https://pypi.org/search/"
 
+        # The results of 'pip show', which are cleared when packages are changed.
+        self._show_cache = {}
+        # The versions of all the installed packages, also cleared on changes.
+        self._installed_cache = None
+
+    def invalidate(self, package=None):
+        """Forget the cached information about installed packages.
+
+        Parameters
+        ----------
+        package : str = None
+            The package to forget, or all packages if None.
+        """
+        if package is None:
+            self._show_cache.clear()
+        else:
+            self._show_cache.pop(package, None)
+        self._installed_cache = None
+
     def install(self, package):
         """Install the requested package.
 
@@ -40,19 +60,47 @@ class Pip(object):
         package : str
             The package of interest.
         """
+        command = ["pip", "install"]
         if isinstance(package, list):
-            packages = " ".join(package)
-            command = f"pip install {packages}"
+            command.extend(package)
         else:
-            command = f"pip install {package}"
+            command.append(package)
+        # Installing one package may change others, so forget them all once pip is
+        # done, so that nothing can cache the listing from before the change.
         try:
-            subprocess.check_output(
-                command, shell=True, text=True, stderr=subprocess.STDOUT
-            )
+            subprocess.check_output(command, text=True, stderr=subprocess.STDOUT)
         except subprocess.CalledProcessError as e:
             logger.warning(f"Calling pip, returncode = {e.returncode}")
             logger.warning(f"Output: {e.output}")
             raise
+        finally:
+            self.invalidate()
+
+    def list_installed(self):
+        """The versions of all the installed packages, from one call to pip.
+
+        The result is cached until a package is installed, updated or uninstalled.
+
+        Returns
+        -------
+        {str: str}
+            The version of each package, keyed by its canonical name, as given
+            by `packaging.utils.canonicalize_name`.
+        """
+        if self._installed_cache is None:
+            command = ["pip", "list", "--format=json"]
+            try:
+                output = subprocess.check_output(command, text=True)
+            except subprocess.CalledProcessError as e:
+                logger.warning(f"Calling pip, returncode = {e.returncode}")
+                logger.warning(f"Output: {e.output}")
+                raise
+
+            self._installed_cache = {
+                canonicalize_name(item["name"]): item["version"]
+                for item in json.loads(output)
+            }
+        return self._installed_cache
 
     def list(self, outdated=False, uptodate=False):
         """List the installed packages.
@@ -66,16 +114,16 @@ class Pip(object):
             If true, list only the up-to-date packages. Cannot be used with
             `outdated`.
         """
-        command = "pip list"
+        command = ["pip", "list"]
         if outdated:
             if uptodate:
                 raise ValueError("May only use one of 'outdated' and 'uptodate'.")
-            command += " --outdated"
+            command.append("--outdated")
         elif uptodate:
-            command += " --uptodate"
+            command.append("--uptodate")
         try:
             output = subprocess.check_output(
-                command, shell=True, text=True, stderr=subprocess.STDOUT
+                command, text=True, stderr=subprocess.STDOUT
             )
         except subprocess.CalledProcessError as e:
             logger.warning(f"Calling pip, returncode = {e.returncode}")
@@ -119,6 +167,9 @@ class Pip(object):
         [str]
             A list of packages matching the query.
         """
+        # requests is slow to import, and only needed to search PyPI.
+        import requests
+
         # Can not have exact match if no query term
         if query is None:
             exact = False
@@ -186,22 +237,28 @@ class Pip(object):
             if update is None:
                 print("", flush=True)
 
-        logger.debug(f"Package information:\n{pprint.pformat(result)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Package information:\n{pprint.pformat(result)}")
 
         return result
 
     def show(self, package):
         """Return the information for an installed package.
 
+        The result is cached until a package is installed, updated or uninstalled.
+
         Parameters
         ----------
         package : str
             The package of interest.
         """
-        command = f"pip show {package}"
+        if package in self._show_cache:
+            return self._show_cache[package]
+
+        command = ["pip", "show", package]
         try:
             result = subprocess.check_output(
-                command, shell=True, text=True, stderr=subprocess.STDOUT
+                command, text=True, stderr=subprocess.STDOUT
             )
         except subprocess.CalledProcessError as e:
             if "Package(s) not found:" in e.output:
@@ -223,8 +280,11 @@ class Pip(object):
             else:
                 data[key] = value
 
-        logger.debug(f"{command}\n{pprint.pformat(data)}")
+        # Formatting the data is slow, so only do it if it will be logged.
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"pip show {package}\n{pprint.pformat(data)}")
 
+        self._show_cache[package] = data
         return data
 
     def uninstall(self, package):
@@ -232,18 +292,24 @@ class Pip(object):
 
         Parameters
         ----------
-        package : str
-            The package of interest.
+        package : str or [str]
+            The package of interest, or a list of packages.
         """
-        command = f"pip uninstall --yes {package}"
+        command = ["pip", "uninstall", "--yes"]
+        if isinstance(package, list):
+            command.extend(package)
+        else:
+            command.append(package)
         try:
             output = subprocess.check_output(
-                command, shell=True, text=True, stderr=subprocess.STDOUT
+                command, text=True, stderr=subprocess.STDOUT
             )
         except subprocess.CalledProcessError as e:
             logger.warning(f"Calling pip, returncode = {e.returncode}")
             logger.warning(f"Output: {e.output}")
             raise
+        finally:
+            self.invalidate()
         logger.debug("pip uninstall -->")
         logger.debug(output)
 
@@ -255,15 +321,13 @@ class Pip(object):
         package : str
             The package of interest.
         """
+        command = ["pip", "install", "--upgrade"]
         if isinstance(package, list):
-            packages = " ".join(package)
-            command = f"pip install --upgrade {packages}"
+            command.extend(package)
         else:
-            command = f"pip install --upgrade {package}"
+            command.append(package)
         try:
-            subprocess.check_output(
-                command, shell=True, text=True, stderr=subprocess.STDOUT
-            )
+            subprocess.check_output(command, text=True, stderr=subprocess.STDOUT)
         except subprocess.CalledProcessError as e:
             line = e.output.splitlines()[-1]
             if "FileNotFoundError" in line:
@@ -272,3 +336,5 @@ class Pip(object):
                 logger.warning(f"Calling pip, returncode = {e.returncode}")
                 logger.warning(f"Output: {e.output}")
                 raise
+        finally:
+            self.invalidate()
@@ -6,8 +6,6 @@ from pathlib import Path
 import platform
 import shutil
 
-from tabulate import tabulate
-
 from . import my
 
 
@@ -26,6 +24,25 @@ else:
 known_services = ["dashboard", "jobserver"]
 
 
+def service_names(services, development):
+    """The installed names of services, which start with 'dev_' for development.
+
+    Parameters
+    ----------
+    services : [str]
+        The services, e.g. 'dashboard'.
+    development : bool
+        Whether these are the development services.
+
+    Returns
+    -------
+    [(str, str)]
+        Each service and its installed name.
+    """
+    prefix = "dev_" if development else ""
+    return [(service, prefix + service) for service in services]
+
+
 def setup(parser):
     """Define the command-line interface for handling services.
 
@@ -97,7 +114,7 @@ def setup(parser):
 
     # restart
     tmp_parser = subparser.add_parser("restart")
-    tmp_parser.set_defaults(func=start)
+    tmp_parser.set_defaults(func=restart)
     tmp_parser.add_argument(
         "services",
         nargs="*",
@@ -138,8 +155,10 @@ def setup(parser):
 
 def create():
     services = mgr.list()
-    for service in my.options.services:
-        service_name = f"dev_{service}" if my.development else service
+    root = my.default_root
+    # stderr and stdout both go to the same log file in this directory
+    log_dir = Path(my.options.root).expanduser() / "logs"
+    for service, service_name in service_names(my.options.services, my.development):
         if service_name in services:
             if my.options.force:
                 mgr.delete(service_name)
@@ -158,9 +177,7 @@ def create():
             print()
             continue
 
-        root = "~/SEAMM_DEV" if my.development else "~/SEAMM"
-        stderr_path = Path(f"{my.options.root}/logs/{service}.out").expanduser()
-        stdout_path = Path(f"{my.options.root}/logs/{service}.out").expanduser()
+        log_path = str(log_dir / f"{service}.out")
 
         if service == "dashboard":
             mgr.create(
@@ -172,8 +189,8 @@ def create():
                 my.options.port,
                 "--dashboard-name",
                 my.options.dashboard_name,
-                stderr_path=str(stderr_path),
-                stdout_path=str(stdout_path),
+                stderr_path=log_path,
+                stdout_path=log_path,
             )
         else:
             mgr.create(
@@ -183,8 +200,8 @@ def create():
                 root,
                 "JobServer",
                 "--no-windows",
-                stderr_path=str(stderr_path),
-                stdout_path=str(stdout_path),
+                stderr_path=log_path,
+                stdout_path=log_path,
             )
         # And start it up
         mgr.start(service_name)
@@ -192,15 +209,13 @@ def create():
 
 
 def delete():
-    for service in my.options.services:
-        service_name = f"dev_{service}" if my.development else service
+    for _, service_name in service_names(my.options.services, my.development):
         mgr.delete(service_name)
         print(f"The service {service_name} was deleted.")
 
 
 def restart():
-    for service in my.options.services:
-        service_name = f"dev_{service}" if my.development else service
+    for _, service_name in service_names(my.options.services, my.development):
         try:
             mgr.restart(service_name)
         except RuntimeError as e:
@@ -212,11 +227,13 @@ def restart():
 
 
 def show():
+    # Only showing or checking the status needs tabulate, so only import it there.
+    from tabulate import tabulate
+
     services = mgr.list()
     table = []
     for development in [False, True] if my.options.all else [my.development]:
-        for service in my.options.services:
-            service_name = f"dev_{service}" if development else service
+        for _, service_name in service_names(my.options.services, development):
             if service_name in services:
                 path = mgr.file_path(service_name)
                 if path.is_relative_to(Path.home()):
@@ -233,8 +250,7 @@ def show():
 
 
 def start():
-    for service in my.options.services:
-        service = f"dev_{service}" if my.development else service
+    for _, service in service_names(my.options.services, my.development):
         if mgr.is_running(service):
             print(f"The service '{service}' was already running.")
         else:
@@ -249,11 +265,12 @@ def start():
 
 
 def status():
+    from tabulate import tabulate
+
     services = mgr.list()
     table = []
     for development in [False, True] if my.options.all else [my.development]:
-        for service in my.options.services:
-            service = f"dev_{service}" if development else service
+        for _, service in service_names(my.options.services, development):
             if service in services:
                 status = mgr.status(service)
                 row = [
@@ -280,8 +297,7 @@ def status():
 
 
 def stop():
-    for service in my.options.services:
-        service_name = f"dev_{service}" if my.development else service
+    for _, service_name in service_names(my.options.services, my.development):
         if mgr.is_running(service_name):
             try:
                 mgr.stop(service_name)
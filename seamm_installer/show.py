@@ -1,12 +1,25 @@
 # -*- coding: utf-8 -*-
 
 """Show the status of the SEAMM installation."""
+import concurrent.futures
+import operator
+import os
+import sys
 import textwrap
 
+from packaging.utils import canonicalize_name
 from tabulate import tabulate
 
 from . import my
-from .util import find_packages, run_plugin_installer
+from .util import (
+    find_installers,
+    find_packages,
+    parse_version,
+    run_plugin_installer,
+)
+
+# Wraps the descriptions for the table, made once rather than for each package.
+_wrapper = textwrap.TextWrapper(width=50)
 
 
 def setup(parser):
@@ -37,67 +50,91 @@ def show():
     data = []
     am_current = True
     state = {}
-    count = 0
+    # One call to pip gives the versions of all the installed packages
+    installed = my.pip.list_installed()
+    installers = find_installers()
+    # The rows for up-to-date packages with their own installer, which are asked
+    # to show more details once all the packages have been checked.
+    details = {}
     for package in packages:
-        count += 1
-        if count > 50:
-            count = 0
-            print("\n.", end="", flush=True)
-        else:
-            print(".", end="", flush=True)
-
         if package in packages and "description" in packages[package]:
             description = packages[package]["description"].strip()
-            description = textwrap.fill(description, width=50)
+            # Most descriptions are short, and fit on one line as they are.
+            if len(description) > 50 or not description.isprintable():
+                description = _wrapper.fill(description)
         else:
             description = "description unavailable"
 
-        try:
-            version = my.pip.show(package)["version"]
-        except Exception:
+        version = installed.get(canonicalize_name(package))
+        if version is None:
             available = packages[package]["version"]
             data.append(["*" + package, "--", available, description])
             am_current = False
             state[package] = "not installed"
         else:
             available = packages[package]["version"]
-            if version < available:
+            out_of_date = parse_version(version) < parse_version(available)
+            if out_of_date:
                 am_current = False
                 state[package] = "not up-to-date"
             else:
                 state[package] = "up-to-date"
-
-                # See if the package has an installer
-                result = run_plugin_installer(package, "show", verbose=False)
-                if result is not None:
-                    if result.returncode == 0:
-                        for line in result.stdout.splitlines():
-                            description += f"\n{line}"
-                    else:
-                        description += (
-                            f"\nThe installer for {package} "
-                            f"returned code {result.returncode}"
-                        )
-                        for line in result.stderr.splitlines():
-                            description += f"\n    {line}"
-            if version < available:
+            if out_of_date:
                 data.append(["*" + package, version, available, description])
             else:
                 data.append([package, version, available, description])
+                if package in installers:
+                    details[package] = data[-1]
+
+    # Run the installers concurrently, since each is a separate process. They are
+    # the only slow part, so show a dot as each finishes.
+    if len(details) > 0:
+        max_workers = min(16, 2 * (os.cpu_count() or 1), len(details))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(
+                    run_plugin_installer,
+                    package,
+                    "show",
+                    verbose=False,
+                    installers=installers,
+                ): package
+                for package in details
+            }
+            for count, future in enumerate(
+                concurrent.futures.as_completed(futures), start=1
+            ):
+                print("." if count % 50 else ".\n", end="", flush=True)
+                package = futures[future]
+                result = future.result()
+                if result is None:
+                    continue
+                row = details[package]
+                lines = [row[3]]
+                if result.returncode == 0:
+                    lines.extend(result.stdout.splitlines())
+                else:
+                    lines.append(
+                        f"The installer for {package} "
+                        f"returned code {result.returncode}"
+                    )
+                    lines.extend(f"    {line}" for line in result.stderr.splitlines())
+                row[3] = "\n".join(lines)
+
+    # The boxes drawn by fancy_grid help people read the table on a terminal, but
+    # are slow to draw and just get in the way when the output is redirected.
+    tablefmt = "fancy_grid" if sys.stdout.isatty() else "simple"
 
     # Sort by the plug-in names
-    for ptype in ("Core package", "MolSSI plug-in", "3rd-party plug-in"):
-        group = []
-        count = 1
-        for m, i, a, d in data:
-            if packages[m.lstrip("*")]["type"] == ptype:
-                group.append([m, i, a, d])
-
-        group.sort(key=lambda x: x[0])
-
-        # And number
-        for i, line in enumerate(group, start=1):
-            line.insert(0, i)
+    groups = {"Core package": [], "MolSSI plug-in": [], "3rd-party plug-in": []}
+    for line in data:
+        ptype = packages[line[0].lstrip("*")]["type"]
+        if ptype in groups:
+            groups[ptype].append(line)
+    for ptype, group in groups.items():
+        # Sort by name and number the rows
+        group.sort(key=operator.itemgetter(0))
+        group = [(i, *line) for i, line in enumerate(group, start=1)]
 
         print("")
         if ptype == "Core package":
@@ -106,7 +143,7 @@ def show():
         else:
             print(f"{ptype}s")
             headers = ["Number", "Plug-in", "Installed", "Available", "Description"]
-        print(tabulate(group, headers, tablefmt="fancy_grid"))
+        print(tabulate(group, headers, tablefmt=tablefmt))
 
     if am_current:
         print("SEAMM is up-to-date.")
@@ -2,7 +2,15 @@
 
 """Uninstall requested components of SEAMM."""
 from . import my
-from .util import find_packages, get_metadata, package_info, run_plugin_installer
+from .util import (
+    find_installers,
+    find_packages,
+    get_metadata,
+    invalidate_packages,
+    package_info,
+    package_types,
+    run_plugin_installer,
+)
 
 
 def setup(parser):
@@ -61,30 +69,59 @@ def uninstall_packages(to_uninstall):
     """Uninstall SEAMM components and plug-ins."""
     metadata = get_metadata()
 
-    # Find all the packages
-    packages = find_packages(progress=True)
-
     if to_uninstall == "all":
+        # Find all the packages
+        packages = find_packages(progress=True)
+
         for package in package_info:
             version, channel = package_info(package)
             ptype = packages[package]["type"]
             print(f"Uninstalling {ptype.lower()} {package}")
             if channel == "pypi":
                 my.pip.uninstall(package)
+                invalidate_packages()
             else:
                 my.conda.uninstall(package)
             # See if the package has an installer
             if not metadata["gui-only"] and not my.options.gui_only:
                 run_plugin_installer(package, "uninstall")
     else:
+        # The packages are named, so there is no need to download the full list.
+        pip_packages = []
+        conda_packages = []
         for package in to_uninstall:
             version, channel = package_info(package)
-            ptype = packages[package]["type"]
+            if channel is None:
+                print(f"{package} is not installed.")
+                continue
+            ptype = package_types.get(package, "3rd-party plug-in")
             print(f"Uninstalling {ptype.lower()} {package}")
             if channel == "pypi":
-                my.pip.uninstall(package)
+                pip_packages.append(package)
             else:
-                my.conda.uninstall(package)
-            # See if the package has an installer
-            if not metadata["gui-only"] and not my.options.gui_only:
-                run_plugin_installer(package, "uninstall")
+                conda_packages.append(package)
+
+        # Uninstall everything with one call to each of pip and conda. Conda removes
+        # none of the packages if it cannot remove them all, so check.
+        removed = []
+        if len(pip_packages) > 0:
+            my.pip.uninstall(pip_packages)
+            invalidate_packages()
+            removed.extend(pip_packages)
+        if len(conda_packages) > 0:
+            result, stdout, stderr = my.conda.uninstall(conda_packages)
+            if result == 0:
+                removed.extend(conda_packages)
+            else:
+                print(
+                    f"Conda could not uninstall {', '.join(conda_packages)}, "
+                    f"returncode = {result}"
+                )
+                print(stderr)
+
+        # See if the packages have installers. These are run one at a time, since
+        # they may themselves remove conda environments.
+        if not metadata["gui-only"] and not my.options.gui_only:
+            installers = find_installers()
+            for package in removed:
+                run_plugin_installer(package, "uninstall", installers=installers)
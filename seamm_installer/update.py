@@ -6,7 +6,16 @@ import platform
 from .datastore import update as update_datastore
 from .metadata import development_packages, development_packages_pip
 from . import my
-from .util import find_packages, get_metadata, package_info, run_plugin_installer
+from .util import (
+    find_installers,
+    find_packages,
+    get_metadata,
+    invalidate_packages,
+    package_info,
+    package_manager,
+    parse_version,
+    run_plugin_installer,
+)
 
 
 system = platform.system()
@@ -60,7 +69,7 @@ def update():
 
     # Need to track packages that require services to be restarted.
     service_packages = ("seamm-datastore", "seamm-dashboard", "seamm-jobserver")
-    initial_version = {p: package_info(p)[0] for p in service_packages}
+    initial_version = installed_versions(service_packages)
 
     if my.options.all:
         # First update the conda environment
@@ -75,7 +84,7 @@ def update():
     if my.development:
         update_development_environment()
 
-    final_version = {p: package_info(p)[0] for p in service_packages}
+    final_version = installed_versions(service_packages)
     # And restart any services that need
     if (
         initial_version["seamm-datastore"] is not None
@@ -113,6 +122,26 @@ def update():
                 print(f"Restarted the {service_name} because it was updated.")
 
 
+def installed_versions(packages):
+    """The installed versions of packages, parsed so that they compare correctly.
+
+    Parameters
+    ----------
+    packages : [str]
+        The names of the packages.
+
+    Returns
+    -------
+    {str: packaging.version.Version}
+        The version of each package, or None if it is not installed.
+    """
+    result = {}
+    for package in packages:
+        version = package_info(package)[0]
+        result[package] = None if version is None else parse_version(version)
+    return result
+
+
 def update_packages(to_update):
     """Update SEAMM components and plug-ins."""
     metadata = get_metadata()
@@ -123,6 +152,8 @@ def update_packages(to_update):
     if to_update == "all":
         to_update = [*packages.keys()]
 
+    # The plug-in installers are run once all the packages are updated.
+    updated = []
     for package in to_update:
         available = packages[package]["version"]
         channel = packages[package]["channel"]
@@ -139,7 +170,7 @@ def update_packages(to_update):
             spec = package
 
         ptype = packages[package]["type"]
-        if installed_version < available:
+        if parse_version(installed_version) < parse_version(available):
             # Convert conda-forge url in channel to 'conda-forge'
             if "/conda-forge" in channel:
                 channel = "conda-forge"
@@ -148,29 +179,24 @@ def update_packages(to_update):
                 f"Updating {ptype.lower()} {package} from version {installed_version} "
                 f"to {available}"
             )
+            manager = package_manager(channel)
             if channel == installed_channel:
-                if channel == "pypi":
-                    if pinned:
-                        my.pip.install(spec)
-                    else:
-                        my.pip.update(spec)
+                if pinned:
+                    manager.install(spec)
                 else:
-                    if pinned:
-                        my.conda.install(spec)
-                    else:
-                        my.conda.update(spec)
+                    manager.update(spec)
             else:
-                if installed_channel == "pypi":
-                    my.pip.uninstall(package)
-                else:
-                    my.conda.uninstall(package)
-                if channel == "pypi":
-                    my.pip.install(spec)
-                else:
-                    my.conda.install(spec)
-        # See if the package has an installer
-        if not metadata["gui-only"] and not my.options.gui_only:
-            run_plugin_installer(package, "update")
+                package_manager(installed_channel).uninstall(package)
+                manager.install(spec)
+        updated.append(package)
+
+    # See if the packages have installers. These are run one at a time, since they
+    # may themselves install into conda environments. Everything is updated by
+    # now, so the PATH only needs searching once.
+    if not metadata["gui-only"] and not my.options.gui_only:
+        installers = find_installers()
+        for package in updated:
+            run_plugin_installer(package, "update", installers=installers)
 
 
 def update_development_environment():
@@ -182,3 +208,4 @@ def update_development_environment():
     packages = [*development_packages_pip]
     print(f"Updating PyPI development packages {' '.join(packages)}")
     my.pip.update(packages)
+    invalidate_packages()
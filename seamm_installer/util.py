@@ -3,27 +3,48 @@
 """Utility methods for the SEAMM installer."""
 
 from datetime import datetime
+import functools
 import json
+import logging
+import os
 from pathlib import Path
-import pkg_resources
+import platform
 import pprint
+import re
 import shutil
 import subprocess
 
-from platformdirs import user_data_dir
-import requests
+from packaging.utils import canonicalize_name
+from packaging.version import InvalidVersion, Version
+from platformdirs import user_cache_dir, user_data_dir
 
 from .conda import Conda
-from .metadata import core_packages, molssi_plug_ins, excluded_plug_ins
+from .metadata import core_packages, molssi_plug_ins
 from . import my
 from .pip import Pip
 
+# The type of each known package, so it can be looked up directly. Any others are
+# 3rd-party plug-ins.
+package_types = {
+    **{package: "MolSSI plug-in" for package in molssi_plug_ins},
+    **{package: "Core package" for package in core_packages},
+}
+
+# The package list downloaded from Zenodo, which is kept for the rest of the run.
+_package_db_text = None
+
+# The metadata for each environment, read once and kept up to date by set_metadata.
+_metadata = {}
+
+# The service managers for this platform, keyed by prefix and created when needed.
+_service_managers = {}
+
 
 class JSONEncoder(json.JSONEncoder):
     """Class for handling the package versions in JSON."""
 
     def default(self, obj):
-        if isinstance(obj, pkg_resources.extern.packaging.version.Version):
+        if isinstance(obj, Version):
             return {"__type__": "Version", "data": str(obj)}
         else:
             return json.JSONEncoder.default(self, obj)
@@ -39,13 +60,84 @@ class JSONDecoder(json.JSONDecoder):
         if "__type__" in d:
             type_ = d.pop("__type__")
             if type_ == "Version":
-                return pkg_resources.parse_version(d["data"])
+                return parse_version(d["data"])
             else:
                 # Oops... better put this back together.
                 d["__type__"] = type
         return d
 
 
+def package_manager(channel):
+    """The package manager, pip or conda, that handles packages from a channel.
+
+    Parameters
+    ----------
+    channel : str
+        The channel, which is 'pypi' for pip and a conda channel otherwise.
+
+    Returns
+    -------
+    Pip or Conda
+        The object for the package manager.
+    """
+    return my.pip if channel == "pypi" else my.conda
+
+
+def get_service_manager(prefix="org.molssi.seamm"):
+    """The service manager for this platform, created on first use.
+
+    The platform-specific module is only imported when services are needed.
+
+    Parameters
+    ----------
+    prefix : str = "org.molssi.seamm"
+        The prefix for the names of the services.
+
+    Returns
+    -------
+    ServiceManager
+        The service manager for the prefix.
+    """
+    if prefix not in _service_managers:
+        system = platform.system()
+        if system in ("Darwin",):
+            from .mac import ServiceManager
+        elif system in ("Linux",):
+            from .linux import ServiceManager
+        else:
+            raise NotImplementedError(
+                f"SEAMM does not support services on {system} yet."
+            )
+        _service_managers[prefix] = ServiceManager(prefix=prefix)
+    return _service_managers[prefix]
+
+
+@functools.lru_cache(maxsize=None)
+def parse_version(version):
+    """Parse a version so that it can be compared correctly.
+
+    Comparing versions as strings gets e.g. "0.10.0" < "0.9.0" wrong. Versions
+    that do not follow PEP 440 are compared by their leading release numbers.
+
+    Parameters
+    ----------
+    version : str or Version
+        The version, either as a string or an already parsed version.
+
+    Returns
+    -------
+    packaging.version.Version
+        The parsed version.
+    """
+    try:
+        return Version(str(version))
+    except InvalidVersion:
+        match = re.match(r"\d+(\.\d+)*", str(version))
+        release = "0" if match is None else match.group()
+        my.logger.warning(f"Version '{version}' is not valid, using {release}")
+        return Version(release)
+
+
 def find_packages(progress=True, update=None, update_cache=False, cache_valid=1):
     """Find the Python packages in SEAMM.
 
@@ -63,139 +155,133 @@ def find_packages(progress=True, update=None, update_cache=False, cache_valid=1)
     dict(str, str)
         A dictionary with information about the packages.
     """
-    if True:
-        url = "https://zenodo.org/api/records/7789854/versions/latest"
-        try:
-            response = requests.get(url)
-            record = response.json(cls=JSONDecoder)
-        except Exception as e:
-            raise RuntimeError(f"Error finding the package list from Zenodo: {str(e)}")
-
-        # Find SEAMM_packages.json
-        url = None
-        for data in record["files"]:
-            if data["key"] == "SEAMM_packages.json":
-                url = data["links"]["self"]
-                break
-        if url is None:
-            raise RuntimeError(
-                "Unable to get the package list from Zenodo. "
-                "There is no file 'SEAMM_packages.json'"
-            )
+    global _package_db_text
 
-        try:
-            response = requests.get(url)
-            package_db = response.json(cls=JSONDecoder)
-        except Exception as e:
-            raise RuntimeError(f"Error getting the package list from Zenodo: {str(e)}")
+    if not update_cache and _package_db_text is None:
+        _package_db_text = _read_package_db(cache_valid)
 
+    if not update_cache and _package_db_text is not None:
+        # Decode it again so that callers can change their copy.
+        package_db = json.loads(_package_db_text, cls=JSONDecoder)
         return package_db["packages"]
 
-    user_data_path = Path(user_data_dir("seamm-installer", appauthor=False))
-    package_db_path = user_data_path / "downloads.json"
-    if package_db_path.exists():
-        try:
-            with package_db_path.open("r") as fd:
-                package_db = json.load(fd, cls=JSONDecoder)
-        except Exception as e:
-            my.logger.warning(f"Exception reading the package cache: {e}")
-            age = cache_valid
-        else:
-            db_date = datetime.fromisoformat(package_db["date"])
-            age = datetime.now() - db_date
-            packages = package_db["packages"]
-    else:
-        user_data_path.mkdir(parents=True, exist_ok=True)
-        age = None
-
-    if not (update_cache or age is None) and age.days < cache_valid:
-        print(f"Using the package database which is {age.days} days old.")
-        print(
-            "    run 'seamm-installer refresh-cache' if you think packages have been "
-            "added or updated recently."
+    # requests is slow to import, and only needed when looking for packages.
+    import requests
+
+    # The package list is published on Zenodo.
+    url = "https://zenodo.org/api/records/7789854/versions/latest"
+    try:
+        response = requests.get(url)
+        record = response.json(cls=JSONDecoder)
+    except Exception as e:
+        raise RuntimeError(f"Error finding the package list from Zenodo: {str(e)}")
+
+    # Find SEAMM_packages.json
+    url = None
+    for data in record["files"]:
+        if data["key"] == "SEAMM_packages.json":
+            url = data["links"]["self"]
+            break
+    if url is None:
+        raise RuntimeError(
+            "Unable to get the package list from Zenodo. "
+            "There is no file 'SEAMM_packages.json'"
         )
 
-        # If the installer has been updated, the list of excluded packages may have
-        # changed. So check.
-        for package in excluded_plug_ins:
-            if package in packages:
-                del packages[package]
+    try:
+        response = requests.get(url)
+        package_db = response.json(cls=JSONDecoder)
+    except Exception as e:
+        raise RuntimeError(f"Error getting the package list from Zenodo: {str(e)}")
+    _package_db_text = response.text
+    _write_package_db(_package_db_text)
 
-        # Convert conda-forge url in channel to 'conda-forge'
-        for data in packages.values():
-            if "/conda-forge" in data["channel"]:
-                data["channel"] = "conda-forge"
+    return package_db["packages"]
 
-        return packages
 
-    # Update the package list and database!
-    print("Finding all the packages that make up SEAMM. This may take several minutes.")
-    # Use pip to find possible packages.
-    packages = my.pip.search(
-        query="SEAMM", progress=progress, newline=False, update=update
-    )
-    for package in excluded_plug_ins:
-        if package in packages:
-            del packages[package]
-
-    # Need to add molsystem and reference-handler by hand
-    for package in core_packages:
-        if package not in packages:
-            tmp = my.pip.search(
-                query=package, exact=True, progress=True, newline=False, update=update
-            )
-            my.logger.debug(f"Query for package {package}\n{pprint.pformat(tmp)}\n")
-            if package in tmp:
-                packages[package] = tmp[package]
-
-    # Set the type
-    for package in packages:
-        if package in core_packages:
-            packages[package]["type"] = "Core package"
-        elif package in molssi_plug_ins:
-            packages[package]["type"] = "MolSSI plug-in"
-        else:
-            packages[package]["type"] = "3rd-party plug-in"
-
-    # Check the versions on conda, and prefer those...
-    my.logger.info("Find packages: checking for conda versions")
-    for package, data in packages.items():
-        my.logger.info(f"    {package}")
-        conda_packages = my.conda.search(
-            package, progress=True, newline=False, update=update
-        )
+def write_file(path, data, mode=0o644):
+    """Write a small file atomically, so that nothing ever sees a partial file.
 
-        if conda_packages is None:
-            continue
+    The data is written to a temporary file in the same directory, flushed to disk
+    and then moved into place.
 
-        tmp = conda_packages[package]
-        if tmp["version"] >= data["version"]:
-            data["version"] = tmp["version"]
-            data["channel"] = tmp["channel"]
-            if "/conda-forge" in data["channel"]:
-                data["channel"] = "conda-forge"
-    if progress:
-        if update is None:
-            print("", flush=True)
-        else:
-            update()
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the file.
+    data : str or bytes
+        The contents of the file. Text is encoded as UTF-8.
+    mode : int = 0o644
+        The permissions for the file.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        with os.fdopen(fd, "wb") as fp:
+            # The mode given to open only applies to new files, and is masked.
+            os.fchmod(fp.fileno(), mode)
+            fp.write(data)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _package_db_path():
+    """The file caching the package list from Zenodo between runs."""
+    cache_path = Path(user_cache_dir("seamm-installer", appauthor=False))
+    return cache_path / "SEAMM_packages.json"
+
+
+def _read_package_db(cache_valid):
+    """Return the cached package list from Zenodo, if it is recent enough.
 
-    # Save the package database for future use
-    package_db = {
-        "date": datetime.now().isoformat(),
-        "packages": packages,
-    }
-    # pprint.pprint(package_db)
-    with package_db_path.open("w") as fd:
-        json.dump(package_db, fd, cls=JSONEncoder, indent=4, sort_keys=True)
-    print(f"Wrote the package database to {str(package_db_path)}.")
+    Parameters
+    ----------
+    cache_valid : int
+        How many days the cached list is valid for.
 
-    # Convert conda-forge url in channel to 'conda-forge'
-    for data in packages.values():
-        if "/conda-forge" in data["channel"]:
-            data["channel"] = "conda-forge"
+    Returns
+    -------
+    str
+        The JSON text of the package list, or None if there is no valid cache.
+    """
+    path = _package_db_path()
+    try:
+        mtime = path.stat().st_mtime
+        text = path.read_text()
+    except OSError:
+        return None
+    age = datetime.now() - datetime.fromtimestamp(mtime)
+    if age.days >= cache_valid:
+        return None
 
-    return packages
+    print(f"Using the package database which is {age.days} days old.")
+    print(
+        "    run 'seamm-installer refresh-cache' if you think packages have been "
+        "added or updated recently."
+    )
+    return text
+
+
+def _write_package_db(text):
+    """Save the package list from Zenodo for later runs.
+
+    Parameters
+    ----------
+    text : str
+        The JSON text of the package list.
+    """
+    path = _package_db_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_file(path, text)
+    except OSError as e:
+        my.logger.debug(f"Could not write the package database: {e}")
 
 
 def get_metadata():
@@ -208,6 +294,9 @@ def get_metadata():
     """
     # Get the metadata for the installation
     environment = my.conda.active_environment
+    # Hand out copies, so that callers cannot change the cached metadata.
+    if environment in _metadata:
+        return dict(_metadata[environment])
     user_data_path = Path(user_data_dir("seamm-installer", appauthor=False))
     path = user_data_path / (environment + ".json")
 
@@ -229,12 +318,33 @@ def get_metadata():
         with path.open("w") as fd:
             json.dump(metadata, fd, cls=JSONEncoder)
 
-    return metadata
+    _metadata[environment] = metadata
+    return dict(metadata)
+
 
+def invalidate_packages():
+    """Forget the installed packages cached by both conda and pip.
 
-def initialize():
+    Conda lists the packages installed by pip as well, so call this after pip
+    changes the environment.
+    """
+    if my.conda is not None:
+        my.conda.invalidate()
+    if my.pip is not None:
+        my.pip.invalidate()
+
+
+def initialize(refresh=False):
+    """Create the Conda and Pip objects used throughout the installer.
+
+    Parameters
+    ----------
+    refresh : bool = False
+        Re-read the Conda information rather than using the cached copy.
+    """
     if my.conda is None:
-        my.conda = Conda()
+        cache_path = Path(user_cache_dir("seamm-installer", appauthor=False))
+        my.conda = Conda(cache_path=cache_path / "conda_info.json", refresh=refresh)
         my.logger.debug("Setup conda in __init__")
     if my.pip is None:
         my.pip = Pip()
@@ -263,7 +373,9 @@ def package_info(package, conda_only=False):
         channel = None
         my.logger.debug("        No.")
     else:
-        my.logger.debug(f"Conda:\n---------\n{pprint.pformat(data)}\n---------\n")
+        # Formatting the data is slow, so only do it if it will be logged.
+        if my.logger.isEnabledFor(logging.DEBUG):
+            my.logger.debug(f"Conda:\n---------\n{pprint.pformat(data)}\n---------\n")
         version = data["version"]
         channel = data["channel"]
         my.logger.info(f"   version {version} installed by conda, channel {channel}")
@@ -273,25 +385,59 @@ def package_info(package, conda_only=False):
     if conda_only:
         return version, channel
 
-    # See if pip knows it is installed
+    # See if pip knows it is installed, using the one listing of all the packages
+    # rather than running 'pip show' for each.
     if channel is None:
         my.logger.debug("    Checking if installed by pip")
         try:
-            data = my.pip.show(package)
+            installed = my.pip.list_installed()
         except Exception as e:
             my.logger.debug("        No.", exc_info=e)
-            pass
         else:
-            my.logger.debug(f"Pip:\n---------\n{pprint.pformat(data)}\n---------\n")
-            if "version" in data:
-                version = data["version"]
+            version = installed.get(canonicalize_name(package))
+            if version is None:
+                my.logger.debug("        No.")
+            else:
                 channel = "pypi"
                 my.logger.info(f"   version {version} installed by pip from pypi")
 
     return version, channel
 
 
-def run_plugin_installer(package, *args, verbose=True):
+def find_installers():
+    """Find all the plug-in installers on the PATH.
+
+    Each directory is listed once, which is much quicker than searching the PATH
+    for each plug-in in turn when most of them have no installer.
+
+    Returns
+    -------
+    {str: str}
+        The path to the installer, keyed by the package name.
+    """
+    suffix = "-installer"
+    installers = {}
+    for directory in os.get_exec_path():
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(suffix):
+                    continue
+                package = entry.name[: -len(suffix)]
+                # As with shutil.which, the first one on the PATH wins.
+                if (
+                    package not in installers
+                    and entry.is_file()
+                    and os.access(entry.path, os.X_OK)
+                ):
+                    installers[package] = entry.path
+    return installers
+
+
+def run_plugin_installer(package, *args, verbose=True, installers=None):
     """Run the plug-in installer with given arguments.
 
     Parameters
@@ -300,6 +446,9 @@ def run_plugin_installer(package, *args, verbose=True):
         The package name for the plug-in. Usually xxxx-step.
     args
         Command-line arguments for the plugin installer.
+    installers : {str: str} = None
+        The installers from find_installers(), to avoid searching the PATH for
+        each package. If None, the PATH is searched.
 
     Returns
     -------
@@ -311,7 +460,10 @@ def run_plugin_installer(package, *args, verbose=True):
     if package == "seamm":
         return None
 
-    installer = shutil.which(f"{package}-installer")
+    if installers is None:
+        installer = shutil.which(f"{package}-installer")
+    else:
+        installer = installers.get(package)
     if installer is None:
         my.logger.info("    no local installer, returning None")
         return None
@@ -339,3 +491,4 @@ def set_metadata(metadata):
     user_data_path.mkdir(parents=True, exist_ok=True)
     with path.open("w") as fd:
         json.dump(metadata, fd, cls=JSONEncoder)
+    _metadata[environment] = dict(metadata)
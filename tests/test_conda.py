@@ -0,0 +1,116 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for running conda and caching 'conda info' in `seamm_installer.conda`."""
+
+import json
+import sys
+
+import pytest
+
+from seamm_installer import conda as conda_module
+from seamm_installer.conda import Conda
+
+
+@pytest.fixture()
+def fake_conda(tmp_path, monkeypatch):
+    """Replace running 'conda info --json' and the cache key with fakes.
+
+    Returns the list of commands run, and a dict holding the current key.
+    """
+    info = {
+        "conda_prefix": str(tmp_path),
+        "root_prefix": str(tmp_path),
+        "envs": [str(tmp_path)],
+    }
+    commands = []
+    state = {"key": ["conda", "1"]}
+
+    def check_output(args, **kwargs):
+        commands.append(args)
+        return json.dumps(info)
+
+    monkeypatch.setattr(conda_module.subprocess, "check_output", check_output)
+    monkeypatch.setattr(Conda, "_cache_key", lambda self: state["key"])
+    return commands, state
+
+
+def test_cache_miss_then_hit(tmp_path, fake_conda):
+    """The first run calls conda and caches the result, which the next run uses."""
+    commands, state = fake_conda
+    cache_path = tmp_path / "conda_info.json"
+
+    first = Conda(cache_path=cache_path)
+    assert len(commands) == 1
+    assert cache_path.exists()
+
+    second = Conda(cache_path=cache_path)
+    assert len(commands) == 1
+    assert second.is_installed
+    assert second.prefix == first.prefix
+
+
+def test_cache_miss_after_key_change(tmp_path, fake_conda):
+    """Changing the key, e.g. conda being updated, ignores the cache."""
+    commands, state = fake_conda
+    cache_path = tmp_path / "conda_info.json"
+
+    Conda(cache_path=cache_path)
+    state["key"] = ["conda", "2"]
+    Conda(cache_path=cache_path)
+    assert len(commands) == 2
+
+    # and the new key is now cached.
+    Conda(cache_path=cache_path)
+    assert len(commands) == 2
+
+
+def test_corrupt_cache(tmp_path, fake_conda):
+    """A corrupt cache file is ignored and replaced."""
+    commands, state = fake_conda
+    cache_path = tmp_path / "conda_info.json"
+    cache_path.write_text("{not json")
+
+    conda = Conda(cache_path=cache_path)
+    assert len(commands) == 1
+    assert conda.is_installed
+    assert json.loads(cache_path.read_text())["key"] == state["key"]
+
+
+def test_refresh_ignores_cache(tmp_path, fake_conda):
+    """Asking for a refresh always runs conda."""
+    commands, state = fake_conda
+    cache_path = tmp_path / "conda_info.json"
+
+    Conda(cache_path=cache_path)
+    Conda(cache_path=cache_path, refresh=True)
+    assert len(commands) == 2
+
+
+def test_execute_large_output(tmp_path, fake_conda):
+    """Both pipes are read in full, so a large output cannot block the command."""
+    conda = Conda(cache_path=tmp_path / "conda_info.json")
+    script = (
+        "import sys; sys.stdout.write('x' * 200000); sys.stderr.write('e' * 100000);"
+        " sys.exit(3)"
+    )
+
+    result, stdout, stderr = conda._execute([sys.executable, "-c", script])
+    assert result == 3
+    assert stdout == "x" * 200000
+    assert stderr == "e" * 100000
+
+
+def test_execute_progress(tmp_path, fake_conda):
+    """The update method is called while the command is quiet."""
+    conda = Conda(cache_path=tmp_path / "conda_info.json")
+    calls = []
+
+    result, stdout, stderr = conda._execute(
+        [sys.executable, "-c", "import time; time.sleep(0.5); print('done')"],
+        poll_interval=0.1,
+        update=lambda: calls.append(True),
+    )
+    assert result == 0
+    assert stdout.strip() == "done"
+    assert len(calls) > 0
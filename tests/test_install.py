@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for installing packages in `seamm_installer.install`."""
+
+import pytest
+
+from seamm_installer import install
+from seamm_installer import my
+
+
+class FakeManager:
+    """A stand-in for Conda or Pip that records the installs and uninstalls."""
+
+    def __init__(self):
+        self.installs = []
+        self.uninstalls = []
+
+    def install(self, packages):
+        self.installs.append(packages)
+
+    def uninstall(self, package):
+        self.uninstalls.append(package)
+        return 0, "", ""
+
+    def invalidate(self, package=None):
+        pass
+
+
+@pytest.fixture()
+def fakes(monkeypatch):
+    """Fake pip, conda, the available and installed packages and the installers."""
+    packages = {
+        "seamm": {"version": "2023.2.1", "channel": "conda-forge", "type": "Core"},
+        "seamm-util": {"version": "2023.2.1", "channel": "pypi", "type": "Core"},
+        "lammps-step": {
+            "version": "2023.2.1",
+            "channel": "conda-forge",
+            "type": "MolSSI plug-in",
+        },
+        "dftbplus-step": {
+            "version": "2023.2.1",
+            "channel": "pypi",
+            "type": "MolSSI plug-in",
+            "pinned": True,
+        },
+    }
+    installed = {
+        "seamm": ("2023.1.1", "conda-forge"),
+        "seamm-util": ("2023.2.1", "pypi"),
+    }
+    conda = FakeManager()
+    pip = FakeManager()
+    installers = []
+
+    monkeypatch.setattr(my, "conda", conda)
+    monkeypatch.setattr(my, "pip", pip)
+    monkeypatch.setattr(install, "find_packages", lambda **kwargs: packages)
+    monkeypatch.setattr(
+        install, "package_info", lambda p: installed.get(p, (None, None))
+    )
+    monkeypatch.setattr(install, "get_metadata", lambda: {"gui-only": False})
+    monkeypatch.setattr(install, "find_installers", lambda: {})
+    monkeypatch.setattr(
+        install,
+        "run_plugin_installer",
+        lambda package, *args, **kwargs: installers.append(package),
+    )
+    return conda, pip, installers
+
+
+def test_install_batched(fakes):
+    """The new packages are installed with one call each to conda and pip."""
+    conda, pip, installers = fakes
+
+    install.install_packages(["seamm", "seamm-util", "lammps-step", "dftbplus-step"])
+
+    assert conda.installs == [["lammps-step"]]
+    assert pip.installs == [["dftbplus-step==2023.2.1"]]
+    assert installers == ["seamm", "seamm-util", "lammps-step", "dftbplus-step"]
+
+
+def test_install_update(fakes):
+    """Updating adds the out-of-date packages to the same batches."""
+    conda, pip, installers = fakes
+
+    install.install_packages(["seamm", "seamm-util", "lammps-step"], update=True)
+
+    assert conda.installs == [["seamm", "lammps-step"]]
+    assert pip.installs == []
+    assert conda.uninstalls == []
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the questions asked by `seamm_installer.InstallerBase`."""
+
+import pytest
+
+from seamm_installer.installer_base import InstallerBase
+
+
+@pytest.fixture()
+def answers(monkeypatch):
+    """Answer the questions from a list, recording the prompts.
+
+    Returns the list of answers to give, and the list of prompts shown.
+    """
+    given = []
+    prompts = []
+
+    def fake_input(prompt):
+        prompts.append(prompt)
+        return given.pop(0)
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    return given, prompts
+
+
+@pytest.fixture()
+def installer():
+    """An installer without the configuration files, which the questions don't use."""
+    return object.__new__(InstallerBase)
+
+
+def test_ask_yes_no(installer, answers):
+    """Answers starting with 'y' or 'n', in either case, are understood."""
+    given, prompts = answers
+    given.extend(["Yes", "n"])
+
+    assert installer.ask_yes_no("Continue?") is True
+    assert installer.ask_yes_no("Continue?") is False
+    assert prompts == ["Continue? y/n: ", "Continue? y/n: "]
+
+
+def test_ask_yes_no_default(installer, answers):
+    """An empty answer gives the default."""
+    given, prompts = answers
+    given.extend(["", ""])
+
+    assert installer.ask_yes_no("Continue?", default="yes") is True
+    assert installer.ask_yes_no("Continue?", default="no") is False
+    assert prompts == ["Continue? [y]/n: ", "Continue? y/[n]: "]
+
+
+def test_ask_yes_no_asks_again(installer, answers):
+    """An answer that is not understood asks again rather than looping forever."""
+    given, prompts = answers
+    given.extend(["maybe", "", "n"])
+
+    assert installer.ask_yes_no("Continue?") is False
+    assert prompts == [
+        "Continue? y/n: ",
+        "Please answer 'y' or 'n': ",
+        "Please answer 'y' or 'n': ",
+    ]
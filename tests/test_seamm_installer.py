@@ -5,8 +5,39 @@
 
 import pytest  # noqa: F401
 import seamm_installer  # noqa: F401
+from seamm_installer.cli import requested_command, wants_help
 
 
 def test_construction():
     """Just create an object and test its type."""
     pass
+
+
+def test_requested_command():
+    """The subcommand is the first positional argument."""
+    assert requested_command(["install", "--all"]) == "install"
+    assert requested_command(["-v", "show"]) == "show"
+    assert requested_command([]) is None
+    assert requested_command(["--help"]) is None
+
+
+def test_requested_command_skips_option_values():
+    """The values of --log-level and --root are not taken as the subcommand."""
+    assert requested_command(["--log-level", "DEBUG", "update"]) == "update"
+    assert requested_command(["--root", "install", "show"]) == "show"
+    assert requested_command(["--log-level", "DEBUG"]) is None
+    assert requested_command(["--log-level"]) is None
+
+
+def test_requested_command_unknown():
+    """An unknown positional argument is not a subcommand."""
+    assert requested_command(["frobnicate", "install"]) is None
+
+
+def test_wants_help():
+    """Only the top-level help, with no subcommand, is wanted."""
+    assert wants_help(["-h"])
+    assert wants_help(["--log-level", "INFO", "--help"])
+    assert not wants_help(["install", "--help"])
+    assert not wants_help(["install"])
+    assert not wants_help([])
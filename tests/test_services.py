@@ -0,0 +1,37 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the command-line interface in `seamm_installer.services`."""
+
+import argparse
+
+import pytest
+
+from seamm_installer import services
+
+
+@pytest.fixture()
+def parser():
+    """A parser with the services subcommands."""
+    result = argparse.ArgumentParser()
+    services.setup(result.add_subparsers())
+    return result
+
+
+@pytest.mark.parametrize(
+    "command, func",
+    [
+        ("start", services.start),
+        ("stop", services.stop),
+        ("restart", services.restart),
+    ],
+)
+def test_dispatch(parser, command, func):
+    """Each subcommand runs its own function, on the known services by default."""
+    options = parser.parse_args(["services", command])
+    assert options.func is func
+    assert options.services == services.known_services
+
+    options = parser.parse_args(["services", command, "dashboard"])
+    assert options.func is func
+    assert options.services == ["dashboard"]
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for uninstalling packages in `seamm_installer.uninstall`."""
+
+import types
+
+import pytest
+
+from seamm_installer import my
+from seamm_installer import uninstall
+
+
+class FakeManager:
+    """A stand-in for Conda or Pip that records the uninstalls."""
+
+    def __init__(self, result=(0, "", "")):
+        self.calls = []
+        self.result = result
+
+    def uninstall(self, package):
+        self.calls.append(package)
+        return self.result
+
+    def invalidate(self, package=None):
+        pass
+
+
+@pytest.fixture()
+def fakes(monkeypatch):
+    """Fake pip, conda, the installed packages and the plug-in installers."""
+    installed = {
+        "seamm": ("2023.1.1", "conda-forge"),
+        "lammps-step": ("2023.2.1", "conda-forge"),
+        "seamm-util": ("2023.1.1", "pypi"),
+    }
+    conda = FakeManager()
+    pip = FakeManager()
+    installers = []
+
+    monkeypatch.setattr(my, "conda", conda)
+    monkeypatch.setattr(my, "pip", pip)
+    monkeypatch.setattr(my, "options", types.SimpleNamespace(gui_only=False))
+    monkeypatch.setattr(
+        uninstall, "package_info", lambda p: installed.get(p, (None, None))
+    )
+    monkeypatch.setattr(uninstall, "get_metadata", lambda: {"gui-only": False})
+    monkeypatch.setattr(uninstall, "find_installers", lambda: {})
+    monkeypatch.setattr(
+        uninstall,
+        "run_plugin_installer",
+        lambda package, *args, **kwargs: installers.append(package),
+    )
+    return conda, pip, installers
+
+
+def test_uninstall_batched(fakes):
+    """The packages are removed with one call each to conda and pip."""
+    conda, pip, installers = fakes
+
+    uninstall.uninstall_packages(["seamm", "lammps-step", "seamm-util"])
+
+    assert conda.calls == [["seamm", "lammps-step"]]
+    assert pip.calls == [["seamm-util"]]
+    assert installers == ["seamm-util", "seamm", "lammps-step"]
+
+
+def test_uninstall_skips_missing(fakes, capsys):
+    """Packages that are not installed are reported and not passed to conda."""
+    conda, pip, installers = fakes
+
+    uninstall.uninstall_packages(["seamm", "not-a-package"])
+
+    assert conda.calls == [["seamm"]]
+    assert pip.calls == []
+    assert "not-a-package is not installed." in capsys.readouterr().out
+    assert installers == ["seamm"]
+
+
+def test_uninstall_conda_failure(fakes, capsys):
+    """A failed conda uninstall is reported and the installers are not run."""
+    conda, pip, installers = fakes
+    conda.result = (1, "", "PackagesNotFoundError")
+
+    uninstall.uninstall_packages(["seamm", "lammps-step"])
+
+    out = capsys.readouterr().out
+    assert "Conda could not uninstall seamm, lammps-step" in out
+    assert "PackagesNotFoundError" in out
+    assert installers == []
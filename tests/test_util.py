@@ -0,0 +1,175 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Tests for the utilities in `seamm_installer.util`."""
+
+import json
+import logging
+import os
+import time
+import types
+
+from packaging.version import Version
+import pytest
+
+from seamm_installer import my
+from seamm_installer import util
+from seamm_installer.util import get_metadata, parse_version, set_metadata
+
+
+@pytest.fixture()
+def logger(monkeypatch):
+    """Give the installer a logger, and start with an empty version cache."""
+    result = logging.getLogger("seamm_installer.test")
+    monkeypatch.setattr(my, "logger", result)
+    parse_version.cache_clear()
+    yield result
+    parse_version.cache_clear()
+
+
+def test_parse_version(logger):
+    """Versions compare numerically, not as strings."""
+    assert parse_version("0.10.0") > parse_version("0.9.0")
+    assert parse_version(Version("1.2.3")) == Version("1.2.3")
+
+
+def test_parse_version_invalid(logger, caplog):
+    """An invalid version warns and falls back to its leading release numbers."""
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        result = parse_version("2023.1.5-custom build")
+    assert result == Version("2023.1.5")
+    assert "2023.1.5-custom build" in caplog.text
+
+    assert parse_version("2023.1.5-custom build") < Version("2023.1.6")
+    assert parse_version("2023.1.5-custom build") > Version("2023.1.4")
+
+
+def test_parse_version_no_numbers(logger, caplog):
+    """A version with no leading numbers sorts before any real version."""
+    with caplog.at_level(logging.WARNING, logger=logger.name):
+        result = parse_version("unknown")
+    assert result == Version("0")
+    assert "unknown" in caplog.text
+    assert result < Version("0.0.1")
+
+
+@pytest.fixture()
+def metadata_dir(tmp_path, monkeypatch):
+    """Keep the metadata in a temporary directory, with an empty cache."""
+    monkeypatch.setattr(util, "user_data_dir", lambda *args, **kwargs: str(tmp_path))
+    monkeypatch.setattr(my, "conda", types.SimpleNamespace(active_environment="seamm"))
+    monkeypatch.setattr(util, "_metadata", {})
+    return tmp_path
+
+
+def test_metadata_copies(metadata_dir):
+    """Changing the metadata returned or given does not change the cached copy."""
+    metadata = get_metadata()
+    assert metadata["gui-only"] is False
+    metadata["gui-only"] = True
+    assert get_metadata()["gui-only"] is False
+
+    set_metadata(metadata)
+    metadata["gui-only"] = False
+    assert get_metadata()["gui-only"] is True
+    assert (metadata_dir / "seamm.json").exists()
+
+
+@pytest.fixture()
+def package_db(tmp_path, monkeypatch):
+    """Keep the package list in a temporary cache directory, with nothing in memory."""
+    monkeypatch.setattr(util, "user_cache_dir", lambda *args, **kwargs: str(tmp_path))
+    monkeypatch.setattr(util, "_package_db_text", None)
+    return tmp_path / "SEAMM_packages.json"
+
+
+def test_package_db_round_trip(package_db, capsys):
+    """A package list written to the cache is read back while it is recent."""
+    text = json.dumps({"packages": {"seamm": {"version": "2023.1.1"}}})
+
+    assert util._read_package_db(1) is None
+    util._write_package_db(text)
+    assert package_db.read_text() == text
+    assert util._read_package_db(1) == text
+    assert "0 days old" in capsys.readouterr().out
+
+
+def test_package_db_expires(package_db):
+    """A cached package list older than the valid time is ignored."""
+    util._write_package_db(json.dumps({"packages": {}}))
+    old = time.time() - 2 * 24 * 60 * 60
+    os.utime(package_db, (old, old))
+
+    assert util._read_package_db(1) is None
+    assert util._read_package_db(3) is not None
+
+
+def test_find_packages_uses_cache(package_db, monkeypatch):
+    """find_packages uses the cached list, and callers get their own copy."""
+    util._write_package_db(json.dumps({"packages": {"seamm": {"version": "1.0"}}}))
+
+    packages = util.find_packages(progress=False)
+    assert packages == {"seamm": {"version": "1.0"}}
+    packages["seamm"]["version"] = "2.0"
+
+    # Even with the file gone, the list is kept in memory for the rest of the run.
+    package_db.unlink()
+    assert util.find_packages(progress=False) == {"seamm": {"version": "1.0"}}
+
+
+def _make_installer(directory, name, executable=True):
+    """Create a dummy installer script in the directory."""
+    directory.mkdir(exist_ok=True)
+    path = directory / name
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755 if executable else 0o644)
+    return path
+
+
+def test_find_installers(tmp_path, monkeypatch):
+    """The first executable installer on the PATH wins, as with shutil.which."""
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    lammps = _make_installer(first, "lammps-step-installer")
+    _make_installer(second, "lammps-step-installer")
+    psi4 = _make_installer(second, "psi4-step-installer")
+    _make_installer(first, "psi4-step-installer", executable=False)
+    _make_installer(first, "seamm")
+    path = os.pathsep.join([str(tmp_path / "missing"), str(first), str(second)])
+    monkeypatch.setenv("PATH", path)
+
+    assert util.find_installers() == {
+        "lammps-step": str(lammps),
+        "psi4-step": str(psi4),
+    }
+
+
+def test_write_file(tmp_path):
+    """The file is written with the given mode, replacing any old contents."""
+    path = tmp_path / "seamm-dashboard.service"
+    path.write_text("old contents\n")
+    path.chmod(0o600)
+
+    util.write_file(path, "[Unit]\nDescription=SEAMM Dashboard\n", mode=0o644)
+    assert path.read_text() == "[Unit]\nDescription=SEAMM Dashboard\n"
+    assert path.stat().st_mode & 0o777 == 0o644
+
+    util.write_file(path, b"#!/bin/sh\n", mode=0o755)
+    assert path.read_bytes() == b"#!/bin/sh\n"
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+
+def test_write_file_failure(tmp_path, monkeypatch):
+    """If writing fails, the old file is untouched and no temporary file is left."""
+    path = tmp_path / "org.molssi.seamm.dashboard.plist"
+    path.write_text("old contents\n")
+
+    def fsync(fd):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(util.os, "fsync", fsync)
+    with pytest.raises(OSError, match="disk full"):
+        util.write_file(path, "new contents\n")
+    assert path.read_text() == "old contents\n"
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]